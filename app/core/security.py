@@ -1,12 +1,34 @@
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import LRUCache
+from jwt import InvalidTokenError
 
 from app.core.config import settings
 from argon2 import PasswordHasher
 
-password_hasher = PasswordHasher()
+# OWASP baseline for Argon2id (19 MiB, t=2, p=1): roughly a third of the library
+# default cost per hash while staying within the recommended range.
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST_KIB = 19_456
+ARGON2_PARALLELISM = 1
+
+password_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST_KIB,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16,
+)
+
+# Verified token payloads keyed by a digest of the raw token; each entry carries
+# its own `exp` so a hit is only served while the token itself is still valid.
+_token_cache: LRUCache = LRUCache(maxsize=10_000)
+_token_cache_lock = threading.Lock()
 
 
 def get_password_hash(password: str) -> str:
@@ -20,6 +42,13 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    try:
+        return password_hasher.check_needs_rehash(hashed_password)
+    except Exception:
+        return False
+
+
 def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
@@ -27,8 +56,33 @@ def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta]
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
 def decode_access_token(token: str) -> dict[str, Any]:
+    cache_key = _token_cache_key(token)
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached is not None:
+        payload, exp_epoch = cached
+        if time.time() < exp_epoch:
+            return dict(payload)
+        with _token_cache_lock:
+            _token_cache.pop(cache_key, None)
+
     try:
-        return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-    except JWTError as exc:
+        payload = jwt.decode(
+            token,
+            settings.secret_key,
+            algorithms=[settings.algorithm],
+            options={"require": ["exp"]},
+        )
+    except InvalidTokenError as exc:
         raise ValueError("Could not validate credentials") from exc
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        with _token_cache_lock:
+            _token_cache[cache_key] = (payload, float(exp))
+    return dict(payload)
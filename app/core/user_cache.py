@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+from cachetools import TTLCache
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models import ReviewStatus, Role, User
+
+# Entries are dropped when this process commits a change to one of the AuthUser fields
+# (see the session hooks below). Writes from another worker process or straight to the
+# database are only picked up once the entry expires, so they may lag by up to this long.
+USER_CACHE_TTL_SECONDS = 10
+
+_AUTH_FIELDS = ("is_active", "role", "review_status")
+_PENDING_KEY = "user_cache_pending_invalidations"
+
+_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_lock = threading.RLock()
+
+
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """Snapshot of the user fields read by the role/approval dependencies."""
+
+    id: int
+    is_active: bool
+    role: Role
+    review_status: ReviewStatus
+
+    @classmethod
+    def from_user(cls, user: User) -> AuthUser:
+        return cls(
+            id=user.id,
+            is_active=user.is_active,
+            role=user.role,
+            review_status=user.review_status,
+        )
+
+
+def get(user_id: int) -> AuthUser | None:
+    with _lock:
+        return _cache.get(user_id)
+
+
+def put(auth_user: AuthUser) -> None:
+    with _lock:
+        _cache[auth_user.id] = auth_user
+
+
+def invalidate(user_id: int | None) -> None:
+    if user_id is None:
+        return
+    with _lock:
+        _cache.pop(user_id, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_auth_changes(session: Session, _flush_context) -> None:
+    # Attribute history is still available here; the cache is only cleared after commit
+    # so a concurrent request cannot re-cache the pre-commit row.
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in session.dirty:
+        if isinstance(obj, User) and any(
+            inspect(obj).attrs[field].history.has_changes() for field in _AUTH_FIELDS
+        ):
+            pending.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            pending.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,91 +1,277 @@
-from typing import Iterator
+from typing import Any, Iterator
 
+from sqlalchemy import Connection, event, make_url
 from sqlmodel import SQLModel, Session, create_engine
 
 from app.core.config import settings
 
 connect_args = {}
+engine_kwargs: dict[str, Any] = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_timeout": 30,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
 if settings.database_url.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
+    # File-backed SQLite needs no liveness checks, but every new connection replays
+    # SQLITE_PRAGMAS; keep enough pooled to cover the request threadpool.
+    engine_kwargs = {"pool_size": 20, "max_overflow": 20}
+    if make_url(settings.database_url).database in (None, "", ":memory:"):
+        engine_kwargs = {}
 
-engine = create_engine(settings.database_url, echo=settings.debug, connect_args=connect_args)
+engine = create_engine(
+    settings.database_url,
+    echo=settings.debug,
+    connect_args=connect_args,
+    **engine_kwargs,
+)
 
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-64000",
+    "mmap_size=268435456",
+    "busy_timeout=5000",
+)
 
-def _ensure_tasks_attachments_column() -> None:
-    if engine.dialect.name != "sqlite":
-        return
+if settings.database_url.startswith("sqlite"):
 
-    with engine.begin() as conn:
-        table_exists = conn.exec_driver_sql(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='tasks'"
-        ).first()
-        if table_exists is None:
-            return
-
-        columns = conn.exec_driver_sql("PRAGMA table_info(tasks)").all()
-        has_attachments = any(row[1] == "attachments" for row in columns)
-        if not has_attachments:
-            conn.exec_driver_sql(
-                "ALTER TABLE tasks ADD COLUMN attachments TEXT NOT NULL DEFAULT '[]'"
-            )
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+        cursor = dbapi_conn.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
 
 
-def _ensure_tasks_accept_limit_column() -> None:
-    if engine.dialect.name != "sqlite":
-        return
+# Columns added after the initial schema; create_all does not alter existing tables.
+SQLITE_COLUMN_MIGRATIONS: dict[str, dict[str, str]] = {
+    "users": {
+        "total_revenue": "FLOAT NOT NULL DEFAULT 0",
+    },
+    "tasks": {
+        "attachments": "TEXT NOT NULL DEFAULT '[]'",
+        "accept_limit": "INTEGER",
+    },
+    "payout_infos": {
+        "bank_description": "TEXT",
+        "wechat_id": "TEXT",
+        "wechat_phone": "TEXT",
+        "wechat_qr_url": "TEXT",
+        "alipay_phone": "TEXT",
+        "alipay_account_name": "TEXT",
+        "alipay_qr_url": "TEXT",
+    },
+}
 
-    with engine.begin() as conn:
-        table_exists = conn.exec_driver_sql(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='tasks'"
-        ).first()
-        if table_exists is None:
-            return
+# Single-column indexes made redundant by a composite index with the same leading
+# column (or not selective enough to be worth their write cost).
+OBSOLETE_INDEXES = (
+    "ix_assignments_status",
+    "ix_assignments_task_id",
+    "ix_assignments_user_id",
+    "ix_manual_metric_submissions_review_status",
+    "ix_metrics_assignment_id",
+    "ix_settlement_records_paid_at",
+    "ix_settlement_records_user_id",
+    "ix_tasks_status",
+    "ix_users_is_active",
+    "ix_users_role",
+    "ix_users_role_review_status",
+)
 
-        columns = conn.exec_driver_sql("PRAGMA table_info(tasks)").all()
-        has_accept_limit = any(row[1] == "accept_limit" for row in columns)
-        if not has_accept_limit:
-            conn.exec_driver_sql("ALTER TABLE tasks ADD COLUMN accept_limit INTEGER")
+_REVENUE_COUNTED = "{row}.status = 'completed' AND {row}.metric_sync_status = 'manual_approved'"
+_VERIFIED_REVENUE = "CASE WHEN {row}.metric_sync_status = 'manual_approved' THEN {row}.revenue ELSE 0 END"
 
+_STATS_ADD_ROW = f"""
+            INSERT INTO assignment_status_stats (status, assignment_count, verified_revenue)
+            VALUES (NEW.status, 1, {_VERIFIED_REVENUE.format(row="NEW")})
+            ON CONFLICT(status) DO UPDATE SET
+                assignment_count = assignment_count + 1,
+                verified_revenue = verified_revenue + excluded.verified_revenue;
+"""
+_STATS_REMOVE_ROW = f"""
+            UPDATE assignment_status_stats SET
+                assignment_count = assignment_count - 1,
+                verified_revenue = verified_revenue - {_VERIFIED_REVENUE.format(row="OLD")}
+            WHERE status = OLD.status;
+"""
 
-def _ensure_payout_infos_columns() -> None:
-    if engine.dialect.name != "sqlite":
+# Keep users.total_revenue equal to the settlement revenue sum of each user's assignments,
+# and assignment_status_stats equal to a GROUP BY status over assignments.
+SQLITE_TRIGGERS: dict[str, str] = {
+    "trg_assignments_revenue_ai": f"""
+        CREATE TRIGGER trg_assignments_revenue_ai AFTER INSERT ON assignments
+        WHEN {_REVENUE_COUNTED.format(row="NEW")}
+        BEGIN
+            UPDATE users SET total_revenue = total_revenue + NEW.revenue WHERE id = NEW.user_id;
+        END
+    """,
+    "trg_assignments_revenue_au": f"""
+        CREATE TRIGGER trg_assignments_revenue_au
+        AFTER UPDATE OF user_id, status, metric_sync_status, revenue ON assignments
+        BEGIN
+            UPDATE users SET total_revenue = total_revenue - OLD.revenue
+            WHERE id = OLD.user_id AND {_REVENUE_COUNTED.format(row="OLD")};
+            UPDATE users SET total_revenue = total_revenue + NEW.revenue
+            WHERE id = NEW.user_id AND {_REVENUE_COUNTED.format(row="NEW")};
+        END
+    """,
+    "trg_assignments_revenue_ad": f"""
+        CREATE TRIGGER trg_assignments_revenue_ad AFTER DELETE ON assignments
+        WHEN {_REVENUE_COUNTED.format(row="OLD")}
+        BEGIN
+            UPDATE users SET total_revenue = total_revenue - OLD.revenue WHERE id = OLD.user_id;
+        END
+    """,
+    "trg_assignments_stats_ai": f"""
+        CREATE TRIGGER trg_assignments_stats_ai AFTER INSERT ON assignments
+        BEGIN
+            {_STATS_ADD_ROW}
+        END
+    """,
+    "trg_assignments_stats_au": f"""
+        CREATE TRIGGER trg_assignments_stats_au
+        AFTER UPDATE OF status, metric_sync_status, revenue ON assignments
+        BEGIN
+            {_STATS_REMOVE_ROW}
+            {_STATS_ADD_ROW}
+        END
+    """,
+    "trg_assignments_stats_ad": f"""
+        CREATE TRIGGER trg_assignments_stats_ad AFTER DELETE ON assignments
+        BEGIN
+            {_STATS_REMOVE_ROW}
+        END
+    """,
+}
+
+
+def _ensure_sqlite_columns(conn: Connection) -> None:
+    if conn.dialect.name != "sqlite":
         return
 
-    with engine.begin() as conn:
-        table_exists = conn.exec_driver_sql(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='payout_infos'"
-        ).first()
-        if table_exists is None:
-            return
+    existing_tables = {
+        row[0]
+        for row in conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        ).all()
+    }
+    for table_name, target_columns in SQLITE_COLUMN_MIGRATIONS.items():
+        if table_name not in existing_tables:
+            continue
 
-        columns = conn.exec_driver_sql("PRAGMA table_info(payout_infos)").all()
+        columns = conn.exec_driver_sql(f"PRAGMA table_info({table_name})").all()
         existing = {row[1] for row in columns}
-        target_columns: dict[str, str] = {
-            "bank_description": "TEXT",
-            "wechat_id": "TEXT",
-            "wechat_phone": "TEXT",
-            "wechat_qr_url": "TEXT",
-            "alipay_phone": "TEXT",
-            "alipay_account_name": "TEXT",
-            "alipay_qr_url": "TEXT",
-        }
-
         for column_name, column_type in target_columns.items():
             if column_name in existing:
                 continue
             conn.exec_driver_sql(
-                f"ALTER TABLE payout_infos ADD COLUMN {column_name} {column_type}"
+                f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
             )
 
 
+def _ensure_indexes(conn: Connection) -> None:
+    for index_name in OBSOLETE_INDEXES:
+        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+    # Bookkeeping table of the old version-gated startup; the checks now run on every start.
+    conn.exec_driver_sql("DROP TABLE IF EXISTS schema_meta")
+
+    # create_all skips existing tables entirely, so indexes declared later need their own pass.
+    for table in SQLModel.metadata.sorted_tables:
+        # table.indexes is a set; sort so every database gets them in the same order.
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            index.create(bind=conn, checkfirst=True)
+
+
+def _normalize_sql(sql: str) -> str:
+    return " ".join(sql.split())
+
+
+def _ensure_sqlite_triggers(conn: Connection) -> None:
+    if conn.dialect.name != "sqlite":
+        return
+
+    existing = {
+        name: _normalize_sql(sql or "")
+        for name, sql in conn.exec_driver_sql(
+            "SELECT name, sql FROM sqlite_master WHERE type='trigger'"
+        ).all()
+    }
+    stale = [
+        name for name, ddl in SQLITE_TRIGGERS.items()
+        if existing.get(name) != _normalize_sql(ddl)
+    ]
+    for trigger_name in stale:
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        conn.exec_driver_sql(SQLITE_TRIGGERS[trigger_name])
+
+    # A missing or changed trigger may have skipped writes, so recompute from scratch.
+    if stale:
+        _backfill_user_revenue(conn)
+    if stale or _assignment_status_stats_missing(conn):
+        _backfill_assignment_status_stats(conn)
+
+
+def _backfill_user_revenue(conn: Connection) -> None:
+    conn.exec_driver_sql(
+        f"""
+        UPDATE users SET total_revenue = COALESCE(
+            (
+                SELECT SUM(assignments.revenue) FROM assignments
+                WHERE assignments.user_id = users.id
+                AND {_REVENUE_COUNTED.format(row="assignments")}
+            ),
+            0
+        )
+        """
+    )
+
+
+def _assignment_status_stats_missing(conn: Connection) -> bool:
+    # An emptied rollup (manual cleanup, restored dump) would otherwise report zero
+    # assignments until the next trigger change.
+    return bool(
+        conn.exec_driver_sql(
+            "SELECT EXISTS (SELECT 1 FROM assignments)"
+            " AND NOT EXISTS (SELECT 1 FROM assignment_status_stats)"
+        ).scalar()
+    )
+
+
+def _backfill_assignment_status_stats(conn: Connection) -> None:
+    conn.exec_driver_sql("DELETE FROM assignment_status_stats")
+    conn.exec_driver_sql(
+        f"""
+        INSERT INTO assignment_status_stats (status, assignment_count, verified_revenue)
+        SELECT status, COUNT(*), COALESCE(SUM({_VERIFIED_REVENUE.format(row="assignments")}), 0)
+        FROM assignments GROUP BY status
+        """
+    )
+
+
 def create_db_and_tables() -> None:
     # Ensure all SQLModel table classes are imported before metadata.create_all.
     import app.models  # noqa: F401
 
-    SQLModel.metadata.create_all(engine)
-    _ensure_tasks_attachments_column()
-    _ensure_tasks_accept_limit_column()
-    _ensure_payout_infos_columns()
+    # Every step checks before it writes, so a startup against an up-to-date schema
+    # only reads the catalog; the backfills run only when a trigger had to be (re)created.
+    with engine.begin() as conn:
+        SQLModel.metadata.create_all(conn)
+        _ensure_sqlite_columns(conn)
+        _ensure_indexes(conn)
+        _ensure_sqlite_triggers(conn)
+
+
+def optimize_db() -> None:
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA optimize")
 
 
 def drop_db_and_tables() -> None:
@@ -98,5 +284,7 @@ def rebuild_db() -> None:
 
 
 def get_session() -> Iterator[Session]:
-    with Session(engine) as session:
+    # Handlers commit and then serialize the objects they just wrote; expiring
+    # them on commit would only cost a reload SELECT per object.
+    with Session(engine, expire_on_commit=False) as session:
         yield session
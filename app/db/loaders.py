@@ -0,0 +1,39 @@
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlmodel import select
+
+from app.core.config import settings
+from app.models import Assignment, AssignmentStatus, Task, User
+
+
+def strict_loads(*loads):
+    # Debug runs turn any relationship a handler forgot to eager-load into an error
+    # instead of a silent per-row lazy load.
+    if settings.debug:
+        return (*loads, raiseload("*"))
+    return loads
+
+
+# Account collections serialized by UserRead, each fetched with one batched IN query.
+USER_ACCOUNT_LOADERS = (
+    selectinload(User.douyin_accounts),
+    selectinload(User.xiaohongshu_accounts),
+    selectinload(User.weibo_accounts),
+)
+
+# Relations serialized by AssignmentRead: the task joins onto the row, while the
+# one-to-many collections use selectin so they do not multiply the parent rows.
+ASSIGNMENT_READ_LOADERS = (
+    joinedload(Assignment.task),
+    selectinload(Assignment.metrics),
+    selectinload(Assignment.manual_metric_submissions),
+)
+
+# Selected next to Task so listings get each task's active count in the same query.
+ACTIVE_ASSIGNMENT_COUNT = (
+    select(func.count(Assignment.id))
+    .where(Assignment.task_id == Task.id)
+    .where(Assignment.status != AssignmentStatus.cancelled)
+    .correlate(Task)
+    .scalar_subquery()
+)
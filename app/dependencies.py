@@ -4,8 +4,10 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel import Session, select
 
+from app.core import user_cache
 from app.core.config import settings
 from app.core.security import decode_access_token
+from app.core.user_cache import AuthUser
 from app.db.database import get_session
 from app.models import ReviewStatus, Role, User
 
@@ -16,31 +18,59 @@ def get_db() -> Generator[Session, None, None]:
     yield from get_session()
 
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[Session, Depends(get_db)],
-) -> User:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _resolve_user_id(token: str) -> int:
     try:
         payload = decode_access_token(token)
     except ValueError:
-        raise credentials_exception
+        raise _credentials_exception()
 
     user_id = payload.get("sub")
     if user_id is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    return int(user_id)
+
 
-    user = db.exec(select(User).where(User.id == int(user_id))).first()
+# The DB-backed dependencies are plain `def` so FastAPI runs them in the threadpool;
+# the cheap role/status checks below stay `async` and never touch the session.
+def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: Annotated[Session, Depends(get_db)],
+) -> User:
+    user_id = _resolve_user_id(token)
+    user = db.exec(select(User).where(User.id == user_id)).first()
     if not user:
-        raise credentials_exception
+        raise _credentials_exception()
+    user_cache.put(AuthUser.from_user(user))
     return user
 
 
+def get_current_auth_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: Annotated[Session, Depends(get_db)],
+) -> AuthUser:
+    user_id = _resolve_user_id(token)
+    auth_user = user_cache.get(user_id)
+    if auth_user is not None:
+        return auth_user
+
+    row = db.exec(
+        select(User.id, User.is_active, User.role, User.review_status).where(User.id == user_id)
+    ).first()
+    if not row:
+        raise _credentials_exception()
+    auth_user = AuthUser(*row)
+    user_cache.put(auth_user)
+    return auth_user
+
+
 async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
@@ -49,9 +79,17 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_active_auth_user(
+    current_user: Annotated[AuthUser, Depends(get_current_auth_user)],
+) -> AuthUser:
+    if not current_user.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
+    return current_user
+
+
 async def get_current_approved_blogger(
-    current_user: Annotated[User, Depends(get_current_active_user)],
-) -> User:
+    current_user: Annotated[AuthUser, Depends(get_current_active_auth_user)],
+) -> AuthUser:
     if current_user.role != Role.blogger:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Blogger role required")
     if current_user.review_status != ReviewStatus.approved:
@@ -60,8 +98,8 @@ async def get_current_approved_blogger(
 
 
 async def get_current_active_admin_user(
-    current_user: Annotated[User, Depends(get_current_active_user)],
-) -> User:
+    current_user: Annotated[AuthUser, Depends(get_current_active_auth_user)],
+) -> AuthUser:
     if current_user.role != Role.admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges")
     return current_user
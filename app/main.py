@@ -1,15 +1,16 @@
 import asyncio
+import hashlib
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from sqlmodel import Session, select
 
 from app.core.security import get_password_hash
 from app.core.config import settings
-from app.db.database import create_db_and_tables, engine
+from app.db.database import create_db_and_tables, engine, optimize_db
 from app.models import PlatformMetricConfig, ReviewStatus, Role, User
 from app.routers import admin, assignments, auth, dashboard, public, tasks, users
 from app.services.scheduler import metrics_update_loop
@@ -17,24 +18,75 @@ from app.services.scheduler import metrics_update_loop
 frontend_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "frontend")
 static_dir = os.path.join(frontend_dir, "static")
 
-
-def _seed_default_platform_configs() -> None:
-    with Session(engine) as session:
-        existing_default = session.exec(
-            select(PlatformMetricConfig).where(PlatformMetricConfig.platform == "default")
-        ).first()
-        if existing_default is None:
-            session.add(PlatformMetricConfig(platform="default"))
-        for platform in ["douyin", "xiaohongshu", "weibo"]:
-            existing = session.exec(
-                select(PlatformMetricConfig).where(PlatformMetricConfig.platform == platform)
-            ).first()
-            if existing is None:
-                session.add(PlatformMetricConfig(platform=platform))
-        session.commit()
+# Frontend page file -> fallback title used when the file is missing.
+HTML_PAGES: dict[str, str] = {
+    "index.html": settings.app_name,
+    "login.html": "登录",
+    "register.html": "注册",
+    "dashboard.html": "仪表盘",
+    "admin_dashboard.html": "管理员控制台",
+    "admin_users.html": "达人审核中心",
+    "admin_settlements.html": "收益结款中心",
+    "admin_reviews.html": "作业审核中心",
+    "admin_tasks.html": "任务运营中心",
+    "tasks.html": "任务",
+    "assignments.html": "分配",
+    "profile.html": "个人资料",
+}
+
+FALLBACK_PAGE_TEMPLATE = """
+<!DOCTYPE html>
+<html lang='zh-CN'>
+<head>
+    <meta charset='UTF-8'>
+    <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+    <title>{title}</title>
+</head>
+<body>
+    <div style='text-align:center;padding:50px;'>
+        <h1>{title}</h1>
+        <p>页面文件未找到。</p>
+        <p><a href='/docs'>API 文档</a></p>
+    </div>
+</body>
+</html>
+"""
+
+# Rendered once; served when a page file is missing from frontend/.
+FALLBACK_PAGES: dict[str, bytes] = {
+    filename: FALLBACK_PAGE_TEMPLATE.format(title=title).encode("utf-8")
+    for filename, title in HTML_PAGES.items()
+}
+
+
+def _load_html_pages() -> dict[str, tuple[bytes, str]]:
+    pages: dict[str, tuple[bytes, str]] = {}
+    for filename in HTML_PAGES:
+        path = os.path.join(frontend_dir, filename)
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            content = f.read()
+        etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+        pages[filename] = (content, etag)
+    return pages
+
+
+def _seed_default_platform_configs(session: Session) -> None:
+    platforms = ["default", "douyin", "xiaohongshu", "weibo"]
+    existing_platforms = set(
+        session.exec(
+            select(PlatformMetricConfig.platform).where(PlatformMetricConfig.platform.in_(platforms))
+        ).all()
+    )
+    session.add_all(
+        PlatformMetricConfig(platform=platform)
+        for platform in platforms
+        if platform not in existing_platforms
+    )
 
 
-def _seed_default_admins() -> None:
+def _seed_default_admins(session: Session) -> None:
     default_admins = [
         {
             "email": "yangliwei@admin",
@@ -51,38 +103,39 @@ def _seed_default_admins() -> None:
             "real_name": "lingxulong@admin",
         },
     ]
-    with Session(engine) as session:
-        existing_admin_emails = set(
-            session.exec(select(User.email).where(User.role == Role.admin)).all()
-        )
-        for admin in default_admins:
-            if admin["email"] in existing_admin_emails:
-                continue
-            session.add(
-                User(
-                    email=admin["email"],
-                    phone=admin["phone"],
-                    username=admin["username"],
-                    display_name=admin["display_name"],
-                    real_name=admin["real_name"],
-                    city="N/A",
-                    category="operations",
-                    tags="admin",
-                    follower_total=0,
-                    avg_views=0,
-                    hashed_password=get_password_hash("ilovemoney"),
-                    role=Role.admin,
-                    review_status=ReviewStatus.approved,
-                )
+    existing_admin_emails = set(
+        session.exec(select(User.email).where(User.role == Role.admin)).all()
+    )
+    for admin in default_admins:
+        if admin["email"] in existing_admin_emails:
+            continue
+        session.add(
+            User(
+                email=admin["email"],
+                phone=admin["phone"],
+                username=admin["username"],
+                display_name=admin["display_name"],
+                real_name=admin["real_name"],
+                city="N/A",
+                category="operations",
+                tags="admin",
+                follower_total=0,
+                avg_views=0,
+                hashed_password=get_password_hash("ilovemoney"),
+                role=Role.admin,
+                review_status=ReviewStatus.approved,
             )
-        session.commit()
+        )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     create_db_and_tables()
-    _seed_default_admins()
-    _seed_default_platform_configs()
+    with Session(engine) as session:
+        _seed_default_admins(session)
+        _seed_default_platform_configs(session)
+        session.commit()
+    app.state.html_pages = _load_html_pages()
 
     stop_event = asyncio.Event()
     scheduler_task = None
@@ -97,6 +150,7 @@ async def lifespan(app: FastAPI):
             stop_event.set()
             scheduler_task.cancel()
             await asyncio.gather(scheduler_task, return_exceptions=True)
+        optimize_db()
 
 
 app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
@@ -116,50 +170,39 @@ for router in (
     app.include_router(router, prefix=settings.api_v1_prefix)
 
 
-def _serve_html(filename: str, fallback_title: str) -> HTMLResponse:
-    path = os.path.join(frontend_dir, filename)
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    return HTMLResponse(
-        content=f"""
-        <!DOCTYPE html>
-        <html lang='zh-CN'>
-        <head>
-            <meta charset='UTF-8'>
-            <meta name='viewport' content='width=device-width, initial-scale=1.0'>
-            <title>{fallback_title}</title>
-        </head>
-        <body>
-            <div style='text-align:center;padding:50px;'>
-                <h1>{fallback_title}</h1>
-                <p>页面文件未找到。</p>
-                <p><a href='/docs'>API 文档</a></p>
-            </div>
-        </body>
-        </html>
-        """
-    )
+def _serve_html(request: Request, filename: str) -> Response:
+    page = getattr(request.app.state, "html_pages", {}).get(filename)
+    if page is None:
+        return Response(
+            content=FALLBACK_PAGES[filename],
+            media_type="text/html; charset=utf-8",
+        )
+
+    content, etag = page
+    headers = {"Cache-Control": "public, max-age=60", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="text/html; charset=utf-8", headers=headers)
 
 
 @app.get("/", response_class=HTMLResponse)
-def read_root() -> HTMLResponse:
-    return _serve_html("index.html", settings.app_name)
+def read_root(request: Request) -> Response:
+    return _serve_html(request, "index.html")
 
 
 @app.get("/login", response_class=HTMLResponse)
-def login_page() -> HTMLResponse:
-    return _serve_html("login.html", "登录")
+def login_page(request: Request) -> Response:
+    return _serve_html(request, "login.html")
 
 
 @app.get("/auth/register", response_class=HTMLResponse)
-def register_page() -> HTMLResponse:
-    return _serve_html("register.html", "注册")
+def register_page(request: Request) -> Response:
+    return _serve_html(request, "register.html")
 
 
 @app.get("/dashboard", response_class=HTMLResponse)
-def dashboard_page() -> HTMLResponse:
-    return _serve_html("dashboard.html", "仪表盘")
+def dashboard_page(request: Request) -> Response:
+    return _serve_html(request, "dashboard.html")
 
 
 @app.get("/admin", response_class=RedirectResponse, include_in_schema=False)
@@ -168,40 +211,40 @@ def admin_redirect() -> RedirectResponse:
 
 
 @app.get("/admin/dashboard", response_class=HTMLResponse)
-def admin_dashboard_page() -> HTMLResponse:
-    return _serve_html("admin_dashboard.html", "管理员控制台")
+def admin_dashboard_page(request: Request) -> Response:
+    return _serve_html(request, "admin_dashboard.html")
 
 
 @app.get("/admin/users", response_class=HTMLResponse)
-def admin_users_page() -> HTMLResponse:
-    return _serve_html("admin_users.html", "达人审核中心")
+def admin_users_page(request: Request) -> Response:
+    return _serve_html(request, "admin_users.html")
 
 
 @app.get("/admin/settlements", response_class=HTMLResponse)
-def admin_settlements_page() -> HTMLResponse:
-    return _serve_html("admin_settlements.html", "收益结款中心")
+def admin_settlements_page(request: Request) -> Response:
+    return _serve_html(request, "admin_settlements.html")
 
 
 @app.get("/admin/reviews", response_class=HTMLResponse)
-def admin_reviews_page() -> HTMLResponse:
-    return _serve_html("admin_reviews.html", "作业审核中心")
+def admin_reviews_page(request: Request) -> Response:
+    return _serve_html(request, "admin_reviews.html")
 
 
 @app.get("/admin/tasks", response_class=HTMLResponse)
-def admin_tasks_page() -> HTMLResponse:
-    return _serve_html("admin_tasks.html", "任务运营中心")
+def admin_tasks_page(request: Request) -> Response:
+    return _serve_html(request, "admin_tasks.html")
 
 
 @app.get("/tasks", response_class=HTMLResponse)
-def tasks_page() -> HTMLResponse:
-    return _serve_html("tasks.html", "任务")
+def tasks_page(request: Request) -> Response:
+    return _serve_html(request, "tasks.html")
 
 
 @app.get("/assignments", response_class=HTMLResponse)
-def assignments_page() -> HTMLResponse:
-    return _serve_html("assignments.html", "分配")
+def assignments_page(request: Request) -> Response:
+    return _serve_html(request, "assignments.html")
 
 
 @app.get("/profile", response_class=HTMLResponse)
-def profile_page() -> HTMLResponse:
-    return _serve_html("profile.html", "个人资料")
+def profile_page(request: Request) -> Response:
+    return _serve_html(request, "profile.html")
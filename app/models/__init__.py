@@ -1,4 +1,5 @@
 from .assignment import Assignment, AssignmentStatus, MetricSyncStatus
+from .assignment_status_stats import AssignmentStatusStats
 from .manual_metric_submission import ManualMetricSubmission, ManualMetricReviewStatus
 from .metric import Metric, MetricSource
 from .platform_metric_config import PlatformMetricConfig
@@ -17,6 +18,7 @@ from .user import ReviewStatus, Role, User, UserPublic
 __all__ = [
     "Assignment",
     "AssignmentStatus",
+    "AssignmentStatusStats",
     "MetricSyncStatus",
     "ManualMetricSubmission",
     "ManualMetricReviewStatus",
@@ -2,6 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
+from sqlalchemy import Index, func
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -23,18 +24,29 @@ class MetricSyncStatus(str, Enum):
 
 class Assignment(SQLModel, table=True):
     __tablename__ = "assignments"
+    __table_args__ = (
+        Index("ix_assignments_task_status", "task_id", "status"),
+        # Covers the per-user revenue sums filtered by status and metric_sync_status.
+        Index("ix_assignments_user_revenue", "user_id", "status", "metric_sync_status", "revenue"),
+        # Admin listing by status and each blogger's own history, both newest first.
+        Index("ix_assignments_status_created_at", "status", "created_at"),
+        Index("ix_assignments_user_created_at", "user_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    task_id: int = Field(foreign_key="tasks.id", index=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
-    status: AssignmentStatus = Field(default=AssignmentStatus.accepted, index=True)
+    task_id: int = Field(foreign_key="tasks.id")
+    user_id: int = Field(foreign_key="users.id")
+    status: AssignmentStatus = Field(default=AssignmentStatus.accepted)
     post_link: Optional[str] = None
     reject_reason: Optional[str] = None
     metric_sync_status: MetricSyncStatus = Field(default=MetricSyncStatus.normal, index=True)
     last_sync_error: Optional[str] = None
     revenue: float = Field(default=0.0, ge=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": datetime.utcnow},
+    )
     last_synced_at: Optional[datetime] = None
 
     task: "Task" = Relationship(back_populates="assignments")
@@ -0,0 +1,13 @@
+from sqlmodel import Field, SQLModel
+
+from .assignment import AssignmentStatus
+
+
+class AssignmentStatusStats(SQLModel, table=True):
+    """Per-status assignment count and verified revenue, maintained by SQLite triggers."""
+
+    __tablename__ = "assignment_status_stats"
+
+    status: AssignmentStatus = Field(primary_key=True)
+    assignment_count: int = Field(default=0)
+    verified_revenue: float = Field(default=0.0)
@@ -2,6 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Index, func
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -13,6 +14,10 @@ class ManualMetricReviewStatus(str, Enum):
 
 class ManualMetricSubmission(SQLModel, table=True):
     __tablename__ = "manual_metric_submissions"
+    __table_args__ = (
+        # Pending review queue in submission order.
+        Index("ix_manual_metric_submissions_review_submitted", "review_status", "submitted_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     assignment_id: int = Field(foreign_key="assignments.id", index=True)
@@ -21,9 +26,9 @@ class ManualMetricSubmission(SQLModel, table=True):
     shares: int = Field(default=0, ge=0)
     views: int = Field(default=0, ge=0)
     note: Optional[str] = None
-    review_status: ManualMetricReviewStatus = Field(default=ManualMetricReviewStatus.pending, index=True)
+    review_status: ManualMetricReviewStatus = Field(default=ManualMetricReviewStatus.pending)
     review_reason: Optional[str] = None
-    submitted_at: datetime = Field(default_factory=datetime.utcnow)
+    submitted_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
     reviewed_at: Optional[datetime] = None
 
     assignment: "Assignment" = Relationship(back_populates="manual_metric_submissions")
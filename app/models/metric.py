@@ -2,6 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Index, func
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -12,10 +13,11 @@ class MetricSource(str, Enum):
 
 class Metric(SQLModel, table=True):
     __tablename__ = "metrics"
+    __table_args__ = (Index("ix_metrics_assignment_timestamp", "assignment_id", "timestamp"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    assignment_id: int = Field(foreign_key="assignments.id", index=True)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    assignment_id: int = Field(foreign_key="assignments.id")
+    timestamp: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
     likes: int = Field(default=0, ge=0)
     favorites: int = Field(default=0, ge=0)
     shares: int = Field(default=0, ge=0)
@@ -2,6 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import func
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -36,7 +37,10 @@ class PayoutInfo(SQLModel, table=True):
     alipay_qr_url: Optional[str] = None
 
     note: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": datetime.utcnow},
+    )
 
     user: "User" = Relationship(back_populates="payout_info")
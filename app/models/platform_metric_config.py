@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import func
 from sqlmodel import Field, SQLModel
 
 
@@ -16,5 +17,8 @@ class PlatformMetricConfig(SQLModel, table=True):
     favorite_weight: float = Field(default=2.0, ge=0)
     share_weight: float = Field(default=3.0, ge=0)
     view_weight: float = Field(default=0.01, ge=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": datetime.utcnow},
+    )
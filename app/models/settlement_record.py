@@ -1,16 +1,21 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index, func
 from sqlmodel import Field, SQLModel
 
 
 class SettlementRecord(SQLModel, table=True):
     __tablename__ = "settlement_records"
+    __table_args__ = (
+        # Per-user payout history newest first, and covers the per-user SUM(amount) / MAX(paid_at).
+        Index("ix_settlement_records_user_paid_at", "user_id", "paid_at", "amount"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     admin_id: int = Field(foreign_key="users.id", index=True)
     amount: float = Field(default=0.0, gt=0)
     note: Optional[str] = None
-    paid_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    paid_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
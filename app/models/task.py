@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, Index, JSON, func
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -14,6 +14,10 @@ class TaskStatus(str, Enum):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Status-filtered listings ordered newest first.
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
@@ -23,8 +27,11 @@ class Task(SQLModel, table=True):
     accept_limit: Optional[int] = Field(default=None, ge=1)
     instructions: str
     attachments: list[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
-    status: TaskStatus = Field(default=TaskStatus.draft, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    status: TaskStatus = Field(default=TaskStatus.draft)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": datetime.utcnow},
+    )
 
     assignments: List["Assignment"] = Relationship(back_populates="task")
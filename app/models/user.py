@@ -2,6 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
+from sqlalchemy import Index, desc, func
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.core.config import settings
@@ -35,17 +36,36 @@ class UserBase(SQLModel):
 
 class User(UserBase, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        # Blogger counts and listings filtered by role and review status; the trailing
+        # columns follow the eligible-blogger ranking so its LIMIT stops after the first rows.
+        Index(
+            "ix_users_role_review_status_ranking",
+            "role",
+            "review_status",
+            desc("weight"),
+            desc("avg_views"),
+            desc("follower_total"),
+            "id",
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     hashed_password: str
-    is_active: bool = Field(default=True, index=True)
+    is_active: bool = Field(default=True)
     review_status: ReviewStatus = Field(default=ReviewStatus.pending, index=True)
     review_reason: Optional[str] = None
     reviewed_at: Optional[datetime] = None
-    role: Role = Field(default=Role.blogger, index=True)
+    role: Role = Field(default=Role.blogger)
     weight: float = Field(default_factory=lambda: settings.default_user_weight, gt=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Settlement-eligible revenue (completed + manual_approved assignments), kept in sync
+    # by SQLite triggers on `assignments`; see SQLITE_TRIGGERS in app/db/database.py.
+    total_revenue: float = Field(default=0.0, sa_column_kwargs={"server_default": "0"})
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": datetime.utcnow},
+    )
 
     douyin_accounts: List["DouyinAccount"] = Relationship(back_populates="user")
     xiaohongshu_accounts: List["XiaohongshuAccount"] = Relationship(back_populates="user")
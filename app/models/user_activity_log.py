@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import func
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -12,6 +13,6 @@ class UserActivityLog(SQLModel, table=True):
     action_type: str = Field(index=True)
     title: str
     detail: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
 
     user: "User" = Relationship(back_populates="activity_logs")
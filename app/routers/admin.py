@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+import hashlib
 import logging
+import threading
 from math import ceil
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from sqlalchemy import func
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from pydantic import TypeAdapter
+from sqlalchemy import and_, case, func, tuple_, update
+from sqlalchemy.orm import joinedload
 from sqlmodel import Session, select
 
+from app.core import user_cache
+from app.core.user_cache import AuthUser
+from app.db.loaders import (
+    ACTIVE_ASSIGNMENT_COUNT,
+    ASSIGNMENT_READ_LOADERS,
+    USER_ACCOUNT_LOADERS,
+    strict_loads,
+)
 from app.dependencies import get_current_active_admin_user, get_db
 from app.models import (
     Assignment,
     AssignmentStatus,
+    AssignmentStatusStats,
     ManualMetricReviewStatus,
     ManualMetricSubmission,
     MetricSyncStatus,
@@ -27,6 +42,9 @@ from app.models import (
     UserActivityLog,
 )
 from app.schemas.assignment import (
+    AssignmentBulkApprove,
+    AssignmentBulkReject,
+    AssignmentBulkResultRead,
     AssignmentRead,
     AssignmentReject,
     ManualMetricReview,
@@ -57,6 +75,8 @@ from app.schemas.task import (
     EligibleBloggerRead,
     EligibleBloggerSummaryRead,
     TaskAttachmentUploadRead,
+    TaskBulkAction,
+    TaskBulkResultRead,
     TaskCreate,
     TaskDistributeRequest,
     TaskDistributeResult,
@@ -67,19 +87,26 @@ from app.schemas.task import (
 from app.schemas.user import (
     AdminUserDetailRead,
     AdminUserReviewSummaryRead,
+    UserBulkResultRead,
+    UserBulkReviewUpdate,
     UserRead,
     UserReviewUpdate,
     UserWeightUpdate,
 )
 from app.services.activity import log_activity
-from app.services.distribution import list_eligible_bloggers, normalize_platform
+from app.services.distribution import (
+    get_eligible_bloggers_preview,
+    invalidate_eligible_bloggers_cache,
+    normalize_platform,
+)
 from app.services.oss import OSSConfigError, upload_task_attachment
+from app.services.revenue import invalidate_revenue_config_cache
 from app.services.sync import apply_manual_metric
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 logger = logging.getLogger(__name__)
 
-ADMIN_FORMULAS = [
+ADMIN_FORMULAS = (
     DashboardMetricFormulaRead(
         key="pending_users",
         label="待审核达人",
@@ -103,19 +130,77 @@ ADMIN_FORMULAS = [
             "自动同步仅作预采集，手工审核通过后才计入结算收益"
         ),
     ),
-]
+)
+
+
+# Several admins polling the overview share one aggregation; generated_at shows its age.
+DASHBOARD_CACHE_TTL_SECONDS = 30
+
+_dashboard_cache: TTLCache = TTLCache(maxsize=1, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+_dashboard_cache_lock = threading.Lock()
+
+SETTLEMENT_SCAN_BATCH_SIZE = 1000
+
+# Checked before the spooled upload is pushed to OSS.
+MAX_TASK_ATTACHMENT_BYTES = 100 * 1024 * 1024
+
+
+# current review status -> (allowed next statuses, error when the target is not allowed)
+_REVIEW_TRANSITIONS: dict[ReviewStatus, tuple[frozenset[ReviewStatus], str]] = {
+    ReviewStatus.pending: (
+        frozenset({ReviewStatus.under_review}),
+        "Pending users must move to under_review first",
+    ),
+    ReviewStatus.under_review: (
+        frozenset({ReviewStatus.approved, ReviewStatus.rejected}),
+        "Under-review users can only be approved or rejected",
+    ),
+    ReviewStatus.approved: (
+        frozenset({ReviewStatus.under_review}),
+        "Approved users can only return to under_review",
+    ),
+    ReviewStatus.rejected: (
+        frozenset({ReviewStatus.under_review}),
+        "Rejected users must return to under_review before a new decision",
+    ),
+}
+
+
+_USER_LIST_ADAPTER = TypeAdapter(list[UserRead])
+_ELIGIBLE_BLOGGER_LIST_ADAPTER = TypeAdapter(list[EligibleBloggerRead])
+_PLATFORM_CONFIG_LIST_ADAPTER = TypeAdapter(list[PlatformMetricConfigRead])
+
 
+def _etag_headers(etag: str) -> dict[str, str]:
+    return {"Cache-Control": "private, no-cache", "ETag": etag}
 
-def _ensure_user_relations_loaded(user: User) -> None:
-    _ = user.douyin_accounts
-    _ = user.xiaohongshu_accounts
-    _ = user.weibo_accounts
 
+def _not_modified(request: Request, etag: str) -> Response | None:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=_etag_headers(etag))
+    return None
 
-def _ensure_assignment_relations_loaded(assignment: Assignment) -> None:
-    _ = assignment.task
-    _ = assignment.metrics
-    _ = assignment.manual_metric_submissions
+
+def _version_etag(*version: object) -> str:
+    return f'"{hashlib.blake2b(repr(version).encode(), digest_size=8).hexdigest()}"'
+
+
+def _etag_json_response(
+    request: Request,
+    adapter: TypeAdapter,
+    data: object,
+    *,
+    etag: str | None = None,
+) -> Response:
+    # Polled admin listings: let the browser revalidate and get a bodiless 304 when unchanged.
+    # Without a precomputed version ETag, the serialized body itself is hashed.
+    body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+    if etag is None:
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return Response(content=body, media_type="application/json", headers=_etag_headers(etag))
 
 
 def _to_admin_activity(assignment: Assignment) -> DashboardActivityRead:
@@ -132,19 +217,6 @@ def _to_admin_activity(assignment: Assignment) -> DashboardActivityRead:
     )
 
 
-def _count_active_assignments_map(db: Session, task_ids: list[int]) -> dict[int, int]:
-    if not task_ids:
-        return {}
-
-    rows = db.exec(
-        select(Assignment.task_id, func.count(Assignment.id))
-        .where(Assignment.task_id.in_(task_ids))
-        .where(Assignment.status != AssignmentStatus.cancelled)
-        .group_by(Assignment.task_id)
-    ).all()
-    return {int(task_id): int(count) for task_id, count in rows}
-
-
 def _to_task_read(task: Task, accepted_count: int) -> TaskRead:
     remaining_slots = None
     is_full = False
@@ -170,10 +242,6 @@ def _to_task_read(task: Task, accepted_count: int) -> TaskRead:
     )
 
 
-def _is_revenue_verified(assignment: Assignment) -> bool:
-    return assignment.metric_sync_status == MetricSyncStatus.manual_approved
-
-
 def _has_valid_payout_info(payout_info: PayoutInfo | None) -> bool:
     if payout_info is None:
         return False
@@ -198,8 +266,32 @@ def _has_valid_payout_info(payout_info: PayoutInfo | None) -> bool:
     return bool((payout_info.account_no or "").strip())
 
 
-def _settlement_status(total_revenue: float, total_settled: float) -> str:
-    pending = round(max(total_revenue - total_settled, 0.0), 2)
+def _has_valid_payout_info_expr():
+    # SQL mirror of _has_valid_payout_info over an outer-joined PayoutInfo row.
+    def filled(column):
+        return func.length(func.trim(func.coalesce(column, ""), " \t\r\n")) > 0
+
+    return case(
+        (PayoutInfo.id.is_(None), False),
+        (PayoutInfo.payout_method == PayoutMethod.bank_card, True),
+        (
+            PayoutInfo.payout_method == PayoutMethod.wechat_pay,
+            and_(filled(PayoutInfo.wechat_id), filled(PayoutInfo.wechat_phone), filled(PayoutInfo.wechat_qr_url)),
+        ),
+        (
+            PayoutInfo.payout_method == PayoutMethod.alipay,
+            and_(
+                filled(PayoutInfo.alipay_phone),
+                filled(PayoutInfo.alipay_account_name),
+                filled(PayoutInfo.alipay_qr_url),
+            ),
+        ),
+        else_=filled(PayoutInfo.account_no),
+    )
+
+
+def _settlement_status(pending: float, total_settled: float) -> str:
+    # pending is the already-rounded pending_settlement of the same summary.
     if pending <= 0 and total_settled > 0:
         return "paid_off"
     if pending > 0 and total_settled > 0:
@@ -209,10 +301,45 @@ def _settlement_status(total_revenue: float, total_settled: float) -> str:
     return "no_revenue"
 
 
+# Settlement revenue for backends without the users.total_revenue trigger.
+_SETTLEMENT_REVENUE_SUM = (
+    select(func.coalesce(func.sum(Assignment.revenue), 0.0))
+    .where(Assignment.user_id == User.id)
+    .where(Assignment.status == AssignmentStatus.completed)
+    .where(Assignment.metric_sync_status == MetricSyncStatus.manual_approved)
+    .correlate(User)
+    .scalar_subquery()
+)
+
+
+def _settlement_revenue_column(db: Session):
+    if _uses_sqlite_triggers(db):
+        return User.total_revenue
+    return _SETTLEMENT_REVENUE_SUM
+
+
+def _settlement_pending_expr(total_revenue, total_settled):
+    # SQL mirror of the pending_settlement computed in _build_settlement_summary.
+    pending = func.round(total_revenue - total_settled, 2)
+    return case((pending > 0, pending), else_=0.0)
+
+
+def _settlement_status_expr(total_revenue, total_settled):
+    # SQL mirror of _settlement_status, so listings can filter before hydrating users.
+    pending = func.round(total_revenue - total_settled, 2)
+    return case(
+        ((pending <= 0) & (total_settled > 0), "paid_off"),
+        ((pending > 0) & (total_settled > 0), "partially_paid"),
+        (pending > 0, "pending"),
+        else_="no_revenue",
+    )
+
+
 def _build_settlement_summary(
     *,
     user: User,
-    payout_info: PayoutInfo | None,
+    preferred_method: PayoutMethod | None,
+    has_valid_payout_info: bool,
     total_revenue: float,
     total_settled: float,
     last_paid_at: datetime | None,
@@ -227,36 +354,32 @@ def _build_settlement_summary(
         phone=user.phone,
         city=user.city,
         review_status=user.review_status.value,
-        preferred_method=payout_info.payout_method if payout_info else PayoutMethod.bank_card,
-        has_valid_payout_info=_has_valid_payout_info(payout_info),
+        preferred_method=preferred_method or PayoutMethod.bank_card,
+        has_valid_payout_info=has_valid_payout_info,
         total_revenue=round(float(total_revenue), 2),
         total_settled=round(float(total_settled), 2),
         pending_settlement=pending,
-        settlement_status=_settlement_status(total_revenue, total_settled),
+        settlement_status=_settlement_status(pending, total_settled),
         last_paid_at=last_paid_at,
     )
 
 
+_ATTACHMENT_URL_PREFIXES = ("http://", "https://")
+
+
 def _normalize_attachment_urls(urls: list[str] | None) -> list[str]:
     if not urls:
         return []
 
-    normalized: list[str] = []
-    seen: set[str] = set()
-    for raw in urls:
-        value = (raw or "").strip()
-        if not value:
-            continue
-        if not (value.startswith("http://") or value.startswith("https://")):
+    values = [value for value in (raw.strip() for raw in urls if raw) if value]
+    for value in values:
+        if not value.startswith(_ATTACHMENT_URL_PREFIXES):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail=f"Attachment URL must start with http:// or https://: {value}",
             )
-        if value in seen:
-            continue
-        seen.add(value)
-        normalized.append(value)
-    return normalized
+    # dict.fromkeys dedupes while keeping first-seen order.
+    return list(dict.fromkeys(values))
 
 
 def _estimate_recommended_scale(eligible_count: int) -> tuple[int, int]:
@@ -287,61 +410,92 @@ def _estimate_saturation_label(saturation_rate: float, eligible_count: int) -> s
     return "高饱和（建议分批放量）"
 
 
-@router.get("/dashboard", response_model=AdminDashboardRead)
-def get_admin_dashboard(
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
-) -> AdminDashboardRead:
-    del current_admin
+def _uses_sqlite_triggers(db: Session) -> bool:
+    # users.total_revenue and assignment_status_stats are kept by the SQLite triggers in
+    # app/db/database.py; other backends compute the same figures from assignments.
+    return db.get_bind().dialect.name == "sqlite"
 
-    tasks = db.exec(select(Task)).all()
-    assignments = db.exec(select(Assignment).order_by(Assignment.created_at.desc())).all()
-    blogger_users = db.exec(select(User).where(User.role == Role.blogger)).all()
-    pending_manual_metrics = db.exec(
-        select(ManualMetricSubmission).where(
-            ManualMetricSubmission.review_status == ManualMetricReviewStatus.pending
-        )
+
+def _assignment_status_rollup(db: Session) -> list[tuple[AssignmentStatus, int, float]]:
+    if _uses_sqlite_triggers(db):
+        return [
+            (row.status, row.assignment_count, row.verified_revenue)
+            for row in db.exec(select(AssignmentStatusStats)).all()
+        ]
+
+    verified_revenue = func.coalesce(
+        func.sum(
+            case(
+                (Assignment.metric_sync_status == MetricSyncStatus.manual_approved, Assignment.revenue),
+                else_=0.0,
+            )
+        ),
+        0.0,
+    )
+    return db.exec(
+        select(Assignment.status, func.count(), verified_revenue).group_by(Assignment.status)
     ).all()
 
+
+def _build_admin_dashboard(db: Session) -> AdminDashboardRead:
+    task_counts: dict[TaskStatus, int] = dict(
+        db.exec(select(Task.status, func.count()).group_by(Task.status)).all()
+    )
+    assignment_rows = _assignment_status_rollup(db)
+    assignment_counts: dict[AssignmentStatus, int] = {
+        row_status: count for row_status, count, _ in assignment_rows
+    }
+    assignment_revenue: dict[AssignmentStatus, float] = {
+        row_status: float(verified_revenue) for row_status, _, verified_revenue in assignment_rows
+    }
+    blogger_counts: dict[ReviewStatus, int] = dict(
+        db.exec(
+            select(User.review_status, func.count())
+            .where(User.role == Role.blogger)
+            .group_by(User.review_status)
+        ).all()
+    )
+    pending_manual_metric_count = db.exec(
+        select(func.count())
+        .select_from(ManualMetricSubmission)
+        .where(ManualMetricSubmission.review_status == ManualMetricReviewStatus.pending)
+    ).one()
+
     task_stats = AdminTaskStatsRead(
-        total=len(tasks),
-        draft=sum(1 for task in tasks if task.status == TaskStatus.draft),
-        published=sum(1 for task in tasks if task.status == TaskStatus.published),
-        cancelled=sum(1 for task in tasks if task.status == TaskStatus.cancelled),
+        total=sum(task_counts.values()),
+        draft=task_counts.get(TaskStatus.draft, 0),
+        published=task_counts.get(TaskStatus.published, 0),
+        cancelled=task_counts.get(TaskStatus.cancelled, 0),
     )
 
     assignment_stats = AdminAssignmentStatsRead(
-        total=len(assignments),
-        accepted=sum(1 for item in assignments if item.status == AssignmentStatus.accepted),
-        in_review=sum(1 for item in assignments if item.status == AssignmentStatus.in_review),
-        completed=sum(1 for item in assignments if item.status == AssignmentStatus.completed),
-        rejected=sum(1 for item in assignments if item.status == AssignmentStatus.rejected),
-        cancelled=sum(1 for item in assignments if item.status == AssignmentStatus.cancelled),
+        total=sum(assignment_counts.values()),
+        accepted=assignment_counts.get(AssignmentStatus.accepted, 0),
+        in_review=assignment_counts.get(AssignmentStatus.in_review, 0),
+        completed=assignment_counts.get(AssignmentStatus.completed, 0),
+        rejected=assignment_counts.get(AssignmentStatus.rejected, 0),
+        cancelled=assignment_counts.get(AssignmentStatus.cancelled, 0),
     )
 
     review_queue = AdminReviewQueueStatsRead(
-        pending_users=sum(1 for user in blogger_users if user.review_status == ReviewStatus.pending),
-        under_review_users=sum(1 for user in blogger_users if user.review_status == ReviewStatus.under_review),
+        pending_users=blogger_counts.get(ReviewStatus.pending, 0),
+        under_review_users=blogger_counts.get(ReviewStatus.under_review, 0),
         pending_assignment_reviews=assignment_stats.in_review,
-        pending_manual_metric_reviews=len(pending_manual_metrics),
+        pending_manual_metric_reviews=pending_manual_metric_count,
     )
 
     revenue = AdminRevenueStatsRead(
-        total_revenue=round(
-            sum(float(item.revenue or 0.0) for item in assignments if _is_revenue_verified(item)),
-            2,
-        ),
-        completed_revenue=round(
-            sum(
-                float(item.revenue or 0.0)
-                for item in assignments
-                if item.status == AssignmentStatus.completed and _is_revenue_verified(item)
-            ),
-            2,
-        ),
+        total_revenue=round(sum(assignment_revenue.values()), 2),
+        completed_revenue=round(assignment_revenue.get(AssignmentStatus.completed, 0.0), 2),
     )
 
-    recent_activities = [_to_admin_activity(item) for item in assignments[:12]]
+    recent_assignments = db.exec(
+        select(Assignment)
+        .options(*strict_loads(joinedload(Assignment.task), joinedload(Assignment.user)))
+        .order_by(Assignment.created_at.desc())
+        .limit(12)
+    ).all()
+    recent_activities = [_to_admin_activity(item) for item in recent_assignments]
 
     return AdminDashboardRead(
         generated_at=datetime.utcnow(),
@@ -354,40 +508,73 @@ def get_admin_dashboard(
     )
 
 
+@router.get("/dashboard", response_model=AdminDashboardRead)
+def get_admin_dashboard(
+    refresh: bool = Query(default=False, description="跳过缓存重新统计"),
+    db: Session = Depends(get_db),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> Response:
+    del current_admin
+    # Held across the rebuild so concurrent misses wait for one aggregation instead of each running it.
+    # The cache holds the serialized body, so hits skip response-model validation entirely.
+    with _dashboard_cache_lock:
+        body = None if refresh else _dashboard_cache.get("dashboard")
+        if body is None:
+            body = _dashboard_cache["dashboard"] = _build_admin_dashboard(db).model_dump_json().encode()
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/users", response_model=list[UserRead])
 def list_users(
+    request: Request,
     role: Role | None = Query(default=None),
     review_status: ReviewStatus | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
-) -> list[User]:
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> Response:
     del current_admin
-    statement = select(User).order_by(User.created_at.desc())
+    filters = []
     if role is not None:
-        statement = statement.where(User.role == role)
+        filters.append(User.role == role)
     if review_status is not None:
-        statement = statement.where(User.review_status == review_status)
+        filters.append(User.review_status == review_status)
 
-    users = db.exec(statement).all()
-    for user in users:
-        _ensure_user_relations_loaded(user)
-    return users
+    statement = (
+        select(User)
+        .options(*strict_loads(*USER_ACCOUNT_LOADERS))
+        .where(*filters)
+        .order_by(User.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    total = db.exec(select(func.count()).select_from(User).where(*filters)).one()
+    response = _etag_json_response(request, _USER_LIST_ADAPTER, db.exec(statement).all())
+    response.headers["X-Total-Count"] = str(total)
+    return response
 
 
 @router.get("/users/review-summary", response_model=AdminUserReviewSummaryRead)
 def get_user_review_summary(
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> AdminUserReviewSummaryRead:
     del current_admin
 
-    bloggers = db.exec(select(User).where(User.role == Role.blogger)).all()
+    blogger_counts: dict[ReviewStatus, int] = dict(
+        db.exec(
+            select(User.review_status, func.count())
+            .where(User.role == Role.blogger)
+            .group_by(User.review_status)
+        ).all()
+    )
     return AdminUserReviewSummaryRead(
-        total=len(bloggers),
-        pending=sum(1 for user in bloggers if user.review_status == ReviewStatus.pending),
-        under_review=sum(1 for user in bloggers if user.review_status == ReviewStatus.under_review),
-        approved=sum(1 for user in bloggers if user.review_status == ReviewStatus.approved),
-        rejected=sum(1 for user in bloggers if user.review_status == ReviewStatus.rejected),
+        total=sum(blogger_counts.values()),
+        pending=blogger_counts.get(ReviewStatus.pending, 0),
+        under_review=blogger_counts.get(ReviewStatus.under_review, 0),
+        approved=blogger_counts.get(ReviewStatus.approved, 0),
+        rejected=blogger_counts.get(ReviewStatus.rejected, 0),
     )
 
 
@@ -395,14 +582,13 @@ def get_user_review_summary(
 def get_user_detail(
     user_id: int,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> AdminUserDetailRead:
     del current_admin
-    user = db.get(User, user_id)
+    user = db.exec(select(User).options(*strict_loads(*USER_ACCOUNT_LOADERS)).where(User.id == user_id)).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    _ensure_user_relations_loaded(user)
     activities = db.exec(
         select(UserActivityLog)
         .where(UserActivityLog.user_id == user_id)
@@ -420,107 +606,104 @@ def get_user_detail(
 def get_settlement_summary(
     keyword: str | None = Query(default=None),
     status_filter: str = Query(default="all", alias="status"),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> AdminSettlementOverviewRead:
     del current_admin
 
-    bloggers = db.exec(
-        select(User)
-        .where(User.role == Role.blogger)
-        .order_by(User.created_at.desc())
-    ).all()
+    settled = (
+        select(
+            SettlementRecord.user_id,
+            func.sum(SettlementRecord.amount).label("total_settled"),
+            func.max(SettlementRecord.paid_at).label("last_paid_at"),
+        )
+        .group_by(SettlementRecord.user_id)
+        .subquery()
+    )
+    total_settled_column = func.coalesce(settled.c.total_settled, 0.0)
+    revenue_column = _settlement_revenue_column(db)
+    pending_column = _settlement_pending_expr(revenue_column, total_settled_column)
 
+    filters = [User.role == Role.blogger]
+    if status_filter != "all":
+        filters.append(_settlement_status_expr(revenue_column, total_settled_column) == status_filter)
     normalized_keyword = (keyword or "").strip().lower()
     if normalized_keyword:
-        bloggers = [
-            user
-            for user in bloggers
-            if normalized_keyword in " ".join(
-                [
-                    (user.display_name or ""),
-                    user.username,
-                    (user.phone or ""),
-                    (user.email or ""),
-                    (user.city or ""),
-                    (user.category or ""),
-                ]
-            ).lower()
-        ]
-
-    user_ids = [user.id for user in bloggers if user.id is not None]
-    payout_map: dict[int, PayoutInfo] = {}
-    if user_ids:
-        payouts = db.exec(select(PayoutInfo).where(PayoutInfo.user_id.in_(user_ids))).all()
-        payout_map = {item.user_id: item for item in payouts}
-
-    revenue_map: dict[int, float] = {}
-    if user_ids:
-        revenue_rows = db.exec(
-            select(
-                Assignment.user_id,
-                func.coalesce(func.sum(Assignment.revenue), 0.0),
-            )
-            .where(Assignment.user_id.in_(user_ids))
-            .where(Assignment.status == AssignmentStatus.completed)
-            .where(Assignment.metric_sync_status == MetricSyncStatus.manual_approved)
-            .group_by(Assignment.user_id)
-        ).all()
-        revenue_map = {int(user_id): float(total or 0.0) for user_id, total in revenue_rows}
-
-    settled_map: dict[int, tuple[float, datetime | None]] = {}
-    if user_ids:
-        settled_rows = db.exec(
-            select(
-                SettlementRecord.user_id,
-                func.coalesce(func.sum(SettlementRecord.amount), 0.0),
-                func.max(SettlementRecord.paid_at),
-            )
-            .where(SettlementRecord.user_id.in_(user_ids))
-            .group_by(SettlementRecord.user_id)
-        ).all()
-        settled_map = {
-            int(user_id): (float(total_amount or 0.0), last_paid_at)
-            for user_id, total_amount, last_paid_at in settled_rows
-        }
-
-    summaries = []
-    for user in bloggers:
-        user_id = user.id or 0
-        total_revenue = revenue_map.get(user_id, 0.0)
-        total_settled, last_paid_at = settled_map.get(user_id, (0.0, None))
-        summaries.append(
-            _build_settlement_summary(
-                user=user,
-                payout_info=payout_map.get(user_id),
-                total_revenue=total_revenue,
-                total_settled=total_settled,
-                last_paid_at=last_paid_at,
-            )
+        searchable = (
+            func.coalesce(User.display_name, "")
+            + " "
+            + User.username
+            + " "
+            + func.coalesce(User.phone, "")
+            + " "
+            + User.email
+            + " "
+            + func.coalesce(User.city, "")
+            + " "
+            + func.coalesce(User.category, "")
         )
+        filters.append(func.lower(searchable).contains(normalized_keyword, autoescape=True))
+
+    # Overview totals cover every matching blogger (two numbers per row); only the user rows are paged.
+    blogger_count = 0
+    total_revenue = 0.0
+    total_settled = 0.0
+    total_pending = 0.0
+    pending_blogger_count = 0
+    for user_revenue, user_settled in db.exec(
+        select(revenue_column, total_settled_column)
+        .select_from(User)
+        .outerjoin(settled, settled.c.user_id == User.id)
+        .where(*filters)
+        .execution_options(yield_per=SETTLEMENT_SCAN_BATCH_SIZE)
+    ):
+        user_revenue = float(user_revenue or 0.0)
+        user_settled = float(user_settled)
+        pending = round(max(user_revenue - user_settled, 0.0), 2)
+        blogger_count += 1
+        total_revenue += round(user_revenue, 2)
+        total_settled += round(user_settled, 2)
+        total_pending += pending
+        if pending > 0:
+            pending_blogger_count += 1
 
-    if status_filter != "all":
-        summaries = [item for item in summaries if item.settlement_status == status_filter]
-
-    summaries.sort(
-        key=lambda item: (
-            -item.pending_settlement,
-            -item.total_revenue,
-            item.user_id,
+    rows = db.exec(
+        select(
+            User,
+            PayoutInfo.payout_method,
+            _has_valid_payout_info_expr(),
+            revenue_column,
+            total_settled_column,
+            settled.c.last_paid_at,
         )
-    )
+        .outerjoin(PayoutInfo, PayoutInfo.user_id == User.id)
+        .outerjoin(settled, settled.c.user_id == User.id)
+        .where(*filters)
+        .order_by(pending_column.desc(), func.round(revenue_column, 2).desc(), User.id)
+        .offset(offset)
+        .limit(limit)
+    ).all()
 
-    total_revenue = round(sum(item.total_revenue for item in summaries), 2)
-    total_settled = round(sum(item.total_settled for item in summaries), 2)
-    total_pending = round(sum(item.pending_settlement for item in summaries), 2)
-    pending_blogger_count = sum(1 for item in summaries if item.pending_settlement > 0)
+    summaries = [
+        _build_settlement_summary(
+            user=user,
+            preferred_method=payout_method,
+            has_valid_payout_info=bool(has_valid_payout_info),
+            total_revenue=float(user_revenue or 0.0),
+            total_settled=float(total_settled),
+            last_paid_at=last_paid_at,
+        )
+        for user, payout_method, has_valid_payout_info, user_revenue, total_settled, last_paid_at in rows
+    ]
 
     return AdminSettlementOverviewRead(
         generated_at=datetime.utcnow(),
-        blogger_count=len(summaries),
-        total_revenue=total_revenue,
-        total_settled=total_settled,
-        total_pending=total_pending,
+        blogger_count=blogger_count,
+        total_revenue=round(total_revenue, 2),
+        total_settled=round(total_settled, 2),
+        total_pending=round(total_pending, 2),
         pending_blogger_count=pending_blogger_count,
         users=summaries,
     )
@@ -530,24 +713,22 @@ def get_settlement_summary(
 def get_settlement_user_detail(
     user_id: int,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> AdminSettlementUserDetailRead:
     del current_admin
-    user = db.get(User, user_id)
-    if not user:
+    row = db.exec(
+        select(User, _settlement_revenue_column(db))
+        .options(*strict_loads(*USER_ACCOUNT_LOADERS))
+        .where(User.id == user_id)
+    ).first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    user, user_revenue = row
     if user.role != Role.blogger:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only blogger is supported")
 
-    _ensure_user_relations_loaded(user)
     payout_info = db.exec(select(PayoutInfo).where(PayoutInfo.user_id == user_id)).first()
 
-    revenue_total = db.exec(
-        select(func.coalesce(func.sum(Assignment.revenue), 0.0))
-        .where(Assignment.user_id == user_id)
-        .where(Assignment.status == AssignmentStatus.completed)
-        .where(Assignment.metric_sync_status == MetricSyncStatus.manual_approved)
-    ).one()
     settled_row = db.exec(
         select(
             func.coalesce(func.sum(SettlementRecord.amount), 0.0),
@@ -559,8 +740,9 @@ def get_settlement_user_detail(
 
     summary = _build_settlement_summary(
         user=user,
-        payout_info=payout_info,
-        total_revenue=float(revenue_total or 0.0),
+        preferred_method=payout_info.payout_method if payout_info else None,
+        has_valid_payout_info=_has_valid_payout_info(payout_info),
+        total_revenue=float(user_revenue or 0.0),
         total_settled=total_settled,
         last_paid_at=last_paid_at,
     )
@@ -573,13 +755,12 @@ def get_settlement_user_detail(
     ).all()
     completed_assignments = db.exec(
         select(Assignment)
+        .options(*strict_loads(joinedload(Assignment.task)))
         .where(Assignment.user_id == user_id)
         .where(Assignment.status == AssignmentStatus.completed)
         .order_by(Assignment.updated_at.desc())
         .limit(50)
     ).all()
-    for assignment in completed_assignments:
-        _ = assignment.task
 
     completed_records = [
         SettlementAssignmentRecordRead(
@@ -621,26 +802,30 @@ def create_settlement_record(
     user_id: int,
     payload: SettlementRecordCreate,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> SettlementRecord:
-    user = db.get(User, user_id)
-    if not user:
+    settled_total_column = (
+        select(func.coalesce(func.sum(SettlementRecord.amount), 0.0))
+        .where(SettlementRecord.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+    )
+    # FOR UPDATE keeps concurrent payouts from both passing the pending check on backends
+    # that support row locks; SQLite omits the clause.
+    row = db.exec(
+        select(User, _settlement_revenue_column(db), settled_total_column)
+        .where(User.id == user_id)
+        .with_for_update(of=User)
+    ).first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    user, user_revenue, settled_total = row
     if user.role != Role.blogger:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only blogger is supported")
     if current_admin.id is None:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid admin identity")
 
-    revenue_total = db.exec(
-        select(func.coalesce(func.sum(Assignment.revenue), 0.0))
-        .where(Assignment.user_id == user_id)
-        .where(Assignment.status == AssignmentStatus.completed)
-        .where(Assignment.metric_sync_status == MetricSyncStatus.manual_approved)
-    ).one()
-    settled_total = db.exec(
-        select(func.coalesce(func.sum(SettlementRecord.amount), 0.0)).where(SettlementRecord.user_id == user_id)
-    ).one()
-    pending = round(max(float(revenue_total or 0.0) - float(settled_total or 0.0), 0.0), 2)
+    pending = round(max(float(user_revenue or 0.0) - float(settled_total or 0.0), 0.0), 2)
     if pending <= 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="当前无待结款金额")
 
@@ -653,12 +838,14 @@ def create_settlement_record(
             detail=f"放款金额不能超过待结款金额 {pending:.2f}",
         )
 
+    now = datetime.utcnow()
     record = SettlementRecord(
         user_id=user_id,
         admin_id=current_admin.id,
         amount=amount,
         note=payload.note,
-        paid_at=datetime.utcnow(),
+        paid_at=now,
+        created_at=now,
     )
     db.add(record)
     log_activity(
@@ -667,9 +854,9 @@ def create_settlement_record(
         action_type="admin_settlement_paid",
         title="管理员登记放款",
         detail=f"操作人ID: {current_admin.id}; 放款金额: {amount:.2f}; 备注: {payload.note or '-'}",
+        created_at=now,
     )
     db.commit()
-    db.refresh(record)
     return record
 
 
@@ -678,9 +865,9 @@ def review_user(
     user_id: int,
     payload: UserReviewUpdate,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> User:
-    user = db.get(User, user_id)
+    user = db.get(User, user_id, options=strict_loads(*USER_ACCOUNT_LOADERS))
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -690,31 +877,9 @@ def review_user(
             detail="Only blogger accounts can be reviewed",
         )
 
-    if user.review_status == ReviewStatus.pending and payload.review_status != ReviewStatus.under_review:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Pending users must move to under_review first",
-        )
-    if user.review_status == ReviewStatus.under_review and payload.review_status not in {
-        ReviewStatus.approved,
-        ReviewStatus.rejected,
-    }:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Under-review users can only be approved or rejected",
-        )
-    if user.review_status == ReviewStatus.approved and payload.review_status not in {
-        ReviewStatus.under_review,
-    }:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Approved users can only return to under_review",
-        )
-    if user.review_status == ReviewStatus.rejected and payload.review_status != ReviewStatus.under_review:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Rejected users must return to under_review before a new decision",
-        )
+    allowed_targets, transition_error = _REVIEW_TRANSITIONS[user.review_status]
+    if payload.review_status not in allowed_targets:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=transition_error)
 
     if payload.review_status == ReviewStatus.rejected and not payload.review_reason:
         raise HTTPException(
@@ -725,8 +890,8 @@ def review_user(
     previous_status = user.review_status
     user.review_status = payload.review_status
     user.review_reason = payload.review_reason if payload.review_status == ReviewStatus.rejected else None
-    user.reviewed_at = datetime.utcnow()
-    user.updated_at = datetime.utcnow()
+    now = datetime.utcnow()
+    user.reviewed_at = now
     db.add(user)
     log_activity(
         db,
@@ -737,27 +902,81 @@ def review_user(
             f"操作人ID: {current_admin.id}; 状态: {previous_status.value} -> {payload.review_status.value}; "
             f"原因: {payload.review_reason or '-'}"
         ),
+        created_at=now,
     )
     db.commit()
-    db.refresh(user)
-    _ensure_user_relations_loaded(user)
+    invalidate_eligible_bloggers_cache()
     return user
 
 
+@router.post("/users/bulk-review", response_model=UserBulkResultRead)
+def bulk_review_users(
+    payload: UserBulkReviewUpdate,
+    db: Session = Depends(get_db),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> UserBulkResultRead:
+    if payload.review_status == ReviewStatus.rejected and not payload.review_reason:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="review_reason is required when rejecting",
+        )
+
+    ids = list(dict.fromkeys(payload.ids))
+    review_reason = payload.review_reason if payload.review_status == ReviewStatus.rejected else None
+    now = datetime.utcnow()
+    previous_statuses: dict[int, ReviewStatus] = {}
+    # One UPDATE per status the target is reachable from, so each log entry knows what it left.
+    for previous_status, (allowed_targets, _) in _REVIEW_TRANSITIONS.items():
+        if payload.review_status not in allowed_targets:
+            continue
+        for user_id in db.exec(
+            update(User)
+            .where(User.id.in_(ids))
+            .where(User.role == Role.blogger)
+            .where(User.review_status == previous_status)
+            .values(review_status=payload.review_status, review_reason=review_reason, reviewed_at=now)
+            .returning(User.id)
+        ).scalars():
+            previous_statuses[user_id] = previous_status
+
+    for user_id, previous_status in previous_statuses.items():
+        log_activity(
+            db,
+            user_id=user_id,
+            action_type="admin_user_review",
+            title="管理员更新审核状态",
+            detail=(
+                f"操作人ID: {current_admin.id}; 状态: {previous_status.value} -> {payload.review_status.value}; "
+                f"原因: {payload.review_reason or '-'}"
+            ),
+            created_at=now,
+        )
+    db.commit()
+    # A bulk UPDATE bypasses the session hooks that keep user_cache current.
+    for user_id in previous_statuses:
+        user_cache.invalidate(user_id)
+    if previous_statuses:
+        invalidate_eligible_bloggers_cache()
+    return UserBulkResultRead(
+        updated_ids=[user_id for user_id in ids if user_id in previous_statuses],
+        skipped_ids=[user_id for user_id in ids if user_id not in previous_statuses],
+    )
+
+
 @router.patch("/users/{user_id}/weight", response_model=UserRead)
 def update_user_weight(
     user_id: int,
     payload: UserWeightUpdate,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> User:
-    user = db.get(User, user_id)
+    user = db.get(User, user_id, options=strict_loads(*USER_ACCOUNT_LOADERS))
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     previous_weight = float(user.weight)
     user.weight = payload.weight
-    user.updated_at = datetime.utcnow()
+    now = datetime.utcnow()
     db.add(user)
     log_activity(
         db,
@@ -765,34 +984,50 @@ def update_user_weight(
         action_type="admin_weight_update",
         title="管理员更新运营权重",
         detail=f"操作人ID: {current_admin.id}; 权重: {previous_weight:.2f} -> {payload.weight:.2f}",
+        created_at=now,
     )
     db.commit()
-    db.refresh(user)
-    _ensure_user_relations_loaded(user)
+    invalidate_eligible_bloggers_cache()
     return user
 
 
 @router.get("/tasks", response_model=list[TaskRead])
 def list_tasks(
+    response: Response,
     status_filter: TaskStatus | None = Query(default=None, alias="status"),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    before: datetime | None = Query(default=None, description="翻页游标：上一页最后一条任务的 created_at"),
+    before_id: int | None = Query(default=None, description="翻页游标：上一页最后一条任务的 id，与 before 一起使用"),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> list[TaskRead]:
     del current_admin
-    statement = select(Task).order_by(Task.created_at.desc())
+    filters = []
     if status_filter is not None:
-        statement = statement.where(Task.status == status_filter)
-    tasks = db.exec(statement).all()
-    task_ids = [task.id for task in tasks if task.id is not None]
-    count_map = _count_active_assignments_map(db, task_ids)
-    return [_to_task_read(task, count_map.get(task.id or 0, 0)) for task in tasks]
+        filters.append(Task.status == status_filter)
+    # (created_at, id) keyset: tasks sharing the boundary timestamp are not skipped.
+    if before is not None and before_id is not None:
+        filters.append(tuple_(Task.created_at, Task.id) < tuple_(before, before_id))
+    elif before is not None:
+        filters.append(Task.created_at < before)
+
+    statement = (
+        select(Task, ACTIVE_ASSIGNMENT_COUNT)
+        .where(*filters)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .limit(limit)
+    )
+    rows = db.exec(statement).all()
+    # Counts from the cursor on, i.e. this page plus everything after it.
+    response.headers["X-Total-Count"] = str(db.exec(select(func.count()).select_from(Task).where(*filters)).one())
+    return [_to_task_read(task, accepted_count) for task, accepted_count in rows]
 
 
 @router.post("/tasks", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
 def create_task(
     payload: TaskCreate,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> Task:
     del current_admin
     task = Task(
@@ -807,7 +1042,6 @@ def create_task(
     )
     db.add(task)
     db.commit()
-    db.refresh(task)
     return task
 
 
@@ -818,14 +1052,20 @@ def create_task(
 )
 async def upload_task_attachment_file(
     file: UploadFile = File(...),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> TaskAttachmentUploadRead:
     del current_admin
     if not file.filename:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid filename")
+    if file.size is not None and file.size > MAX_TASK_ATTACHMENT_BYTES:
+        await file.close()
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"附件大小不能超过 {MAX_TASK_ATTACHMENT_BYTES // (1024 * 1024)} MB",
+        )
 
     try:
-        url, object_key = upload_task_attachment(file)
+        url, object_key = await asyncio.to_thread(upload_task_attachment, file)
     except OSSConfigError as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc))
     except Exception as exc:
@@ -845,7 +1085,7 @@ def update_task(
     task_id: int,
     payload: TaskUpdate,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> Task:
     del current_admin
     task = db.get(Task, task_id)
@@ -857,11 +1097,9 @@ def update_task(
         updates["attachments"] = _normalize_attachment_urls(updates["attachments"])
     for field_name, value in updates.items():
         setattr(task, field_name, value)
-    task.updated_at = datetime.utcnow()
 
     db.add(task)
     db.commit()
-    db.refresh(task)
     return task
 
 
@@ -869,38 +1107,82 @@ def update_task(
 def publish_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
-) -> Task:
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> TaskRead:
     del current_admin
-    task = db.get(Task, task_id)
+    task = db.exec(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(status=TaskStatus.published)
+        .returning(Task)
+    ).scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
-    task.status = TaskStatus.published
-    task.updated_at = datetime.utcnow()
-    db.add(task)
+    # Serialize before commit; the returned row already carries every column.
+    response = TaskRead.model_validate(task)
     db.commit()
-    db.refresh(task)
-    return task
+    return response
 
 
 @router.post("/tasks/{task_id}/cancel", response_model=TaskRead)
 def cancel_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
-) -> Task:
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> TaskRead:
     del current_admin
-    task = db.get(Task, task_id)
+    task = db.exec(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(status=TaskStatus.cancelled)
+        .returning(Task)
+    ).scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
-    task.status = TaskStatus.cancelled
-    task.updated_at = datetime.utcnow()
-    db.add(task)
+    # Serialize before commit; the returned row already carries every column.
+    response = TaskRead.model_validate(task)
     db.commit()
-    db.refresh(task)
-    return task
+    return response
+
+
+def _bulk_set_task_status(db: Session, ids: list[int], target: TaskStatus) -> TaskBulkResultRead:
+    ids = list(dict.fromkeys(ids))
+    updated_ids = set(
+        db.exec(
+            update(Task)
+            .where(Task.id.in_(ids))
+            .where(Task.status != target)
+            .values(status=target)
+            .returning(Task.id)
+        ).scalars()
+    )
+    db.commit()
+    return TaskBulkResultRead(
+        updated_ids=[task_id for task_id in ids if task_id in updated_ids],
+        skipped_ids=[task_id for task_id in ids if task_id not in updated_ids],
+    )
+
+
+@router.post("/tasks/bulk-publish", response_model=TaskBulkResultRead)
+def bulk_publish_tasks(
+    payload: TaskBulkAction,
+    db: Session = Depends(get_db),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> TaskBulkResultRead:
+    del current_admin
+    return _bulk_set_task_status(db, payload.ids, TaskStatus.published)
+
+
+@router.post("/tasks/bulk-cancel", response_model=TaskBulkResultRead)
+def bulk_cancel_tasks(
+    payload: TaskBulkAction,
+    db: Session = Depends(get_db),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> TaskBulkResultRead:
+    del current_admin
+    return _bulk_set_task_status(db, payload.ids, TaskStatus.cancelled)
 
 
 @router.get("/tasks/eligible-bloggers-estimate", response_model=TaskEligibleEstimateRead)
@@ -909,7 +1191,7 @@ def estimate_task_eligible_bloggers(
     accept_limit: int | None = Query(default=None, ge=1, le=50000),
     preview_limit: int = Query(default=12, ge=1, le=200),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> TaskEligibleEstimateRead:
     del current_admin
     normalized_platform = normalize_platform(platform)
@@ -928,8 +1210,7 @@ def estimate_task_eligible_bloggers(
         attachments=[],
         status=TaskStatus.draft,
     )
-    eligible = list_eligible_bloggers(db, task_for_estimate)
-    preview_users = eligible[:preview_limit]
+    eligible_count, preview_users = get_eligible_bloggers_preview(db, task_for_estimate, limit=preview_limit)
     preview_bloggers = [
         EligibleBloggerRead(
             user_id=user.id,
@@ -944,7 +1225,6 @@ def estimate_task_eligible_bloggers(
         if user.id is not None
     ]
 
-    eligible_count = len(eligible)
     estimated_accept_count = min(eligible_count, accept_limit) if accept_limit is not None else eligible_count
     saturation_rate = (estimated_accept_count / eligible_count) if eligible_count > 0 else 0.0
     recommended_scale_min, recommended_scale_max = _estimate_recommended_scale(eligible_count)
@@ -965,11 +1245,12 @@ def estimate_task_eligible_bloggers(
 
 @router.get("/tasks/{task_id}/eligible-bloggers", response_model=list[EligibleBloggerRead])
 def list_task_eligible_bloggers(
+    request: Request,
     task_id: int,
     limit: int = Query(default=100, ge=1, le=500),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
-) -> list[EligibleBloggerRead]:
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> Response:
     del current_admin
     task = db.get(Task, task_id)
     if not task:
@@ -982,8 +1263,8 @@ def list_task_eligible_bloggers(
 
     platform = normalize_platform(task.platform)
     platform_value = platform.value if platform is not None else task.platform
-    bloggers = list_eligible_bloggers(db, task)[:limit]
-    return [
+    _, bloggers = get_eligible_bloggers_preview(db, task, limit=limit)
+    eligible_bloggers = [
         EligibleBloggerRead(
             user_id=user.id,
             username=user.username,
@@ -996,6 +1277,7 @@ def list_task_eligible_bloggers(
         for user in bloggers
         if user.id is not None
     ]
+    return _etag_json_response(request, _ELIGIBLE_BLOGGER_LIST_ADAPTER, eligible_bloggers)
 
 
 @router.get("/tasks/{task_id}/eligible-bloggers-summary", response_model=EligibleBloggerSummaryRead)
@@ -1003,7 +1285,7 @@ def get_task_eligible_bloggers_summary(
     task_id: int,
     preview_limit: int = Query(default=20, ge=1, le=500),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> EligibleBloggerSummaryRead:
     del current_admin
     task = db.get(Task, task_id)
@@ -1017,8 +1299,7 @@ def get_task_eligible_bloggers_summary(
 
     platform = normalize_platform(task.platform)
     platform_value = platform.value if platform is not None else task.platform
-    eligible = list_eligible_bloggers(db, task)
-    preview_users = eligible[:preview_limit]
+    eligible_count, preview_users = get_eligible_bloggers_preview(db, task, limit=preview_limit)
     preview_bloggers = [
         EligibleBloggerRead(
             user_id=user.id,
@@ -1035,7 +1316,7 @@ def get_task_eligible_bloggers_summary(
     return EligibleBloggerSummaryRead(
         task_id=task.id or 0,
         platform=platform_value,
-        eligible_count=len(eligible),
+        eligible_count=eligible_count,
         preview_limit=preview_limit,
         preview_bloggers=preview_bloggers,
     )
@@ -1046,7 +1327,7 @@ def distribute_task_to_bloggers(
     task_id: int,
     payload: TaskDistributeRequest,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> TaskDistributeResult:
     del current_admin
     del payload
@@ -1061,51 +1342,114 @@ def distribute_task_to_bloggers(
 
 @router.get("/assignments", response_model=list[AssignmentRead])
 def list_assignments(
+    response: Response,
     status_filter: AssignmentStatus | None = Query(default=None, alias="status"),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> list[Assignment]:
     del current_admin
-    statement = select(Assignment).order_by(Assignment.created_at.desc())
+    filters = []
     if status_filter is not None:
-        statement = statement.where(Assignment.status == status_filter)
+        filters.append(Assignment.status == status_filter)
+
+    statement = (
+        select(Assignment)
+        .options(*strict_loads(*ASSIGNMENT_READ_LOADERS))
+        .where(*filters)
+        .order_by(Assignment.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    response.headers["X-Total-Count"] = str(
+        db.exec(select(func.count()).select_from(Assignment).where(*filters)).one()
+    )
+    return db.exec(statement).all()
+
+
+@router.post("/assignments/bulk-approve", response_model=AssignmentBulkResultRead)
+def bulk_approve_assignments(
+    payload: AssignmentBulkApprove,
+    db: Session = Depends(get_db),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> AssignmentBulkResultRead:
+    del current_admin
+    ids = list(dict.fromkeys(payload.ids))
+    updated_ids = set(
+        db.exec(
+            update(Assignment)
+            .where(Assignment.id.in_(ids))
+            .where(Assignment.status == AssignmentStatus.in_review)
+            .where(Assignment.metric_sync_status == MetricSyncStatus.manual_approved)
+            .values(status=AssignmentStatus.completed, reject_reason=None)
+            .returning(Assignment.id)
+        ).scalars()
+    )
+    db.commit()
+    return AssignmentBulkResultRead(
+        updated_ids=[assignment_id for assignment_id in ids if assignment_id in updated_ids],
+        skipped_ids=[assignment_id for assignment_id in ids if assignment_id not in updated_ids],
+    )
 
-    assignments = db.exec(statement).all()
-    for assignment in assignments:
-        _ensure_assignment_relations_loaded(assignment)
-    return assignments
+
+@router.post("/assignments/bulk-reject", response_model=AssignmentBulkResultRead)
+def bulk_reject_assignments(
+    payload: AssignmentBulkReject,
+    db: Session = Depends(get_db),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> AssignmentBulkResultRead:
+    del current_admin
+    ids = list(dict.fromkeys(payload.ids))
+    updated_ids = set(
+        db.exec(
+            update(Assignment)
+            .where(Assignment.id.in_(ids))
+            .where(Assignment.status == AssignmentStatus.in_review)
+            .values(status=AssignmentStatus.rejected, reject_reason=payload.reason)
+            .returning(Assignment.id)
+        ).scalars()
+    )
+    db.commit()
+    return AssignmentBulkResultRead(
+        updated_ids=[assignment_id for assignment_id in ids if assignment_id in updated_ids],
+        skipped_ids=[assignment_id for assignment_id in ids if assignment_id not in updated_ids],
+    )
 
 
 @router.post("/assignments/{assignment_id}/approve", response_model=AssignmentRead)
 def approve_assignment(
     assignment_id: int,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
-) -> Assignment:
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> AssignmentRead:
     del current_admin
-    assignment = db.get(Assignment, assignment_id)
+    # The transition guards live in the WHERE clause; only a miss needs a second look.
+    assignment = db.exec(
+        update(Assignment)
+        .where(Assignment.id == assignment_id)
+        .where(Assignment.status == AssignmentStatus.in_review)
+        .where(Assignment.metric_sync_status == MetricSyncStatus.manual_approved)
+        .values(status=AssignmentStatus.completed, reject_reason=None)
+        .returning(Assignment)
+    ).scalar_one_or_none()
     if not assignment:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assignment not found")
-
-    if assignment.status != AssignmentStatus.in_review:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only in_review assignments can be approved",
-        )
-    if assignment.metric_sync_status != MetricSyncStatus.manual_approved:
+        existing = db.get(Assignment, assignment_id)
+        if not existing:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assignment not found")
+        if existing.status != AssignmentStatus.in_review:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only in_review assignments can be approved",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Manual metrics must be approved before assignment approval",
         )
 
-    assignment.status = AssignmentStatus.completed
-    assignment.reject_reason = None
-    assignment.updated_at = datetime.utcnow()
-    db.add(assignment)
+    response = AssignmentRead.model_validate(assignment)
     db.commit()
-    db.refresh(assignment)
-    _ensure_assignment_relations_loaded(assignment)
-    return assignment
+    return response
 
 
 @router.post("/assignments/{assignment_id}/reject", response_model=AssignmentRead)
@@ -1113,40 +1457,51 @@ def reject_assignment(
     assignment_id: int,
     payload: AssignmentReject,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
-) -> Assignment:
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> AssignmentRead:
     del current_admin
-    assignment = db.get(Assignment, assignment_id)
+    assignment = db.exec(
+        update(Assignment)
+        .where(Assignment.id == assignment_id)
+        .where(Assignment.status == AssignmentStatus.in_review)
+        .values(status=AssignmentStatus.rejected, reject_reason=payload.reason)
+        .returning(Assignment)
+    ).scalar_one_or_none()
     if not assignment:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assignment not found")
-
-    if assignment.status != AssignmentStatus.in_review:
+        if not db.get(Assignment, assignment_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assignment not found")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only in_review assignments can be rejected",
         )
 
-    assignment.status = AssignmentStatus.rejected
-    assignment.reject_reason = payload.reason
-    assignment.updated_at = datetime.utcnow()
-    db.add(assignment)
+    response = AssignmentRead.model_validate(assignment)
     db.commit()
-    db.refresh(assignment)
-    _ensure_assignment_relations_loaded(assignment)
-    return assignment
+    return response
 
 
 @router.get("/manual-metrics/pending", response_model=list[ManualMetricSubmissionRead])
 def list_pending_manual_metrics(
+    limit: int | None = Query(default=None, ge=1, le=500),
+    after: datetime | None = Query(default=None, description="翻页游标：上一页最后一条记录的 submitted_at"),
+    after_id: int | None = Query(default=None, description="翻页游标：上一页最后一条记录的 id，与 after 一起使用"),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> list[ManualMetricSubmission]:
     del current_admin
-    return db.exec(
-        select(ManualMetricSubmission).where(
-            ManualMetricSubmission.review_status == ManualMetricReviewStatus.pending
+    statement = (
+        select(ManualMetricSubmission)
+        .where(ManualMetricSubmission.review_status == ManualMetricReviewStatus.pending)
+        .order_by(ManualMetricSubmission.submitted_at, ManualMetricSubmission.id)
+        .limit(limit)
+    )
+    if after is not None and after_id is not None:
+        statement = statement.where(
+            tuple_(ManualMetricSubmission.submitted_at, ManualMetricSubmission.id) > tuple_(after, after_id)
         )
-    ).all()
+    elif after is not None:
+        statement = statement.where(ManualMetricSubmission.submitted_at > after)
+    return db.exec(statement).all()
 
 
 @router.post("/manual-metrics/{submission_id}/review", response_model=ManualMetricSubmissionRead)
@@ -1154,21 +1509,29 @@ def review_manual_metric_submission(
     submission_id: int,
     payload: ManualMetricReview,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> ManualMetricSubmission:
     del current_admin
-    submission = db.get(ManualMetricSubmission, submission_id)
-    if not submission:
+    # Submission, assignment and the task/user that the revenue calculation reads,
+    # in one round-trip.
+    row = db.exec(
+        select(ManualMetricSubmission, Assignment)
+        .outerjoin(Assignment, Assignment.id == ManualMetricSubmission.assignment_id)
+        .options(joinedload(Assignment.task), joinedload(Assignment.user))
+        .where(ManualMetricSubmission.id == submission_id)
+    ).first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Manual submission not found")
 
+    submission, assignment = row
     if submission.review_status != ManualMetricReviewStatus.pending:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Submission already reviewed")
 
-    assignment = db.get(Assignment, submission.assignment_id)
     if not assignment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assignment not found")
 
-    submission.reviewed_at = datetime.utcnow()
+    now = datetime.utcnow()
+    submission.reviewed_at = now
     submission.review_reason = payload.review_reason
 
     if payload.approved:
@@ -1180,27 +1543,36 @@ def review_manual_metric_submission(
             favorites=submission.favorites,
             shares=submission.shares,
             views=submission.views,
+            now=now,
         )
     else:
         submission.review_status = ManualMetricReviewStatus.rejected
         assignment.metric_sync_status = MetricSyncStatus.manual_rejected
         assignment.last_sync_error = payload.review_reason or "Manual metrics rejected"
-        assignment.updated_at = datetime.utcnow()
 
     db.add(assignment)
     db.add(submission)
     db.commit()
-    db.refresh(submission)
     return submission
 
 
 @router.get("/platform-configs", response_model=list[PlatformMetricConfigRead])
 def list_platform_configs(
+    request: Request,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
-) -> list[PlatformMetricConfig]:
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
+) -> Response:
     del current_admin
-    return db.exec(select(PlatformMetricConfig)).all()
+    # Configs are only inserted or updated (updated_at is bumped on every change), so the
+    # row count and latest updated_at version the list without loading it.
+    etag = _version_etag(
+        *db.exec(select(func.count(), func.max(PlatformMetricConfig.updated_at))).one()
+    )
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    configs = db.exec(select(PlatformMetricConfig)).all()
+    return _etag_json_response(request, _PLATFORM_CONFIG_LIST_ADAPTER, configs, etag=etag)
 
 
 @router.put("/platform-configs/{platform}", response_model=PlatformMetricConfigRead)
@@ -1208,7 +1580,7 @@ def upsert_platform_config(
     platform: str,
     payload: PlatformMetricConfigUpsert,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_active_admin_user),
+    current_admin: AuthUser = Depends(get_current_active_admin_user),
 ) -> PlatformMetricConfig:
     del current_admin
     config = db.exec(select(PlatformMetricConfig).where(PlatformMetricConfig.platform == platform)).first()
@@ -1221,9 +1593,8 @@ def upsert_platform_config(
     config.favorite_weight = payload.favorite_weight
     config.share_weight = payload.share_weight
     config.view_weight = payload.view_weight
-    config.updated_at = datetime.utcnow()
 
     db.add(config)
     db.commit()
-    db.refresh(config)
+    invalidate_revenue_config_cache()
     return config
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlmodel import Session, select
 
+from app.core.user_cache import AuthUser
 from app.db.database import engine
+from app.db.loaders import ASSIGNMENT_READ_LOADERS, strict_loads
 from app.dependencies import get_current_approved_blogger, get_db
 from app.models import (
     Assignment,
@@ -14,7 +15,6 @@ from app.models import (
     ManualMetricSubmission,
     ManualMetricReviewStatus,
     MetricSyncStatus,
-    User,
 )
 from app.schemas.assignment import (
     AssignmentRead,
@@ -28,25 +28,17 @@ from app.services.sync import sync_assignment_metrics_once
 router = APIRouter(prefix="/assignments", tags=["assignments"])
 
 
-def _ensure_assignment_relations_loaded(assignment: Assignment) -> None:
-    _ = assignment.task
-    _ = assignment.metrics
-    _ = assignment.manual_metric_submissions
-
-
 @router.get("/me", response_model=list[AssignmentRead])
 def list_user_assignments(
-    current_user: User = Depends(get_current_approved_blogger),
+    current_user: AuthUser = Depends(get_current_approved_blogger),
     db: Session = Depends(get_db),
 ) -> list[Assignment]:
-    assignments = db.exec(
+    return db.exec(
         select(Assignment)
+        .options(*strict_loads(*ASSIGNMENT_READ_LOADERS))
         .where(Assignment.user_id == current_user.id)
         .order_by(Assignment.created_at.desc())
     ).all()
-    for assignment in assignments:
-        _ensure_assignment_relations_loaded(assignment)
-    return assignments
 
 
 @router.post("/{assignment_id}/submit", response_model=AssignmentRead)
@@ -54,10 +46,10 @@ def submit_assignment(
     assignment_id: int,
     submission: AssignmentSubmit,
     background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_approved_blogger),
+    current_user: AuthUser = Depends(get_current_approved_blogger),
     db: Session = Depends(get_db),
 ) -> Assignment:
-    assignment = db.get(Assignment, assignment_id)
+    assignment = db.get(Assignment, assignment_id, options=strict_loads(*ASSIGNMENT_READ_LOADERS))
     if not assignment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assignment not found")
     if assignment.user_id != current_user.id:
@@ -77,7 +69,6 @@ def submit_assignment(
     assignment.last_sync_error = None
     assignment.last_synced_at = None
     assignment.revenue = 0.0
-    assignment.updated_at = datetime.utcnow()
     db.add(assignment)
     log_activity(
         db,
@@ -87,11 +78,9 @@ def submit_assignment(
         detail=f"任务分配ID: {assignment.id}",
     )
     db.commit()
-    db.refresh(assignment)
 
     background_tasks.add_task(_sync_once_task, assignment.id)
 
-    _ensure_assignment_relations_loaded(assignment)
     return assignment
 
 
@@ -103,7 +92,7 @@ def submit_assignment(
 def submit_manual_metrics(
     assignment_id: int,
     payload: ManualMetricSubmit,
-    current_user: User = Depends(get_current_approved_blogger),
+    current_user: AuthUser = Depends(get_current_approved_blogger),
     db: Session = Depends(get_db),
 ) -> ManualMetricSubmission:
     assignment = db.get(Assignment, assignment_id)
@@ -140,7 +129,6 @@ def submit_manual_metrics(
     db.add(submission)
 
     assignment.metric_sync_status = MetricSyncStatus.manual_pending_review
-    assignment.updated_at = datetime.utcnow()
     db.add(assignment)
     log_activity(
         db,
@@ -151,7 +139,6 @@ def submit_manual_metrics(
     )
 
     db.commit()
-    db.refresh(submission)
     return submission
 
 
@@ -165,6 +152,5 @@ def _sync_once_task(assignment_id: int) -> None:
         except Exception:
             assignment.metric_sync_status = MetricSyncStatus.manual_required
             assignment.last_sync_error = "Background sync failed"
-            assignment.updated_at = datetime.utcnow()
             session.add(assignment)
         session.commit()
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from fastapi import APIRouter, Depends, Form, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
 from app.core.config import settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import (
+    create_access_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
 from app.dependencies import get_db
 from app.models import (
     DouyinAccount,
@@ -24,49 +30,42 @@ from app.schemas.user import UserCreate, UserRead
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-def _create_platform_accounts(db: Session, user_id: int, user_in: UserCreate) -> None:
-    for account in user_in.douyin_accounts:
-        db.add(
-            DouyinAccount(
-                user_id=user_id,
-                account_name=account.account_name,
-                account_id=account.account_id,
-                profile_url=account.profile_url,
-                follower_count=account.follower_count,
-            )
+def _build_platform_accounts(user: User, user_in: UserCreate) -> None:
+    # Assigned through the relationships so one flush inserts them with the user's new id
+    # and UserRead serializes the collections without loading them back.
+    user.douyin_accounts = [
+        DouyinAccount(
+            account_name=account.account_name,
+            account_id=account.account_id,
+            profile_url=account.profile_url,
+            follower_count=account.follower_count,
         )
-    for account in user_in.xiaohongshu_accounts:
-        db.add(
-            XiaohongshuAccount(
-                user_id=user_id,
-                account_name=account.account_name,
-                account_id=account.account_id,
-                profile_url=account.profile_url,
-                follower_count=account.follower_count,
-            )
+        for account in user_in.douyin_accounts
+    ]
+    user.xiaohongshu_accounts = [
+        XiaohongshuAccount(
+            account_name=account.account_name,
+            account_id=account.account_id,
+            profile_url=account.profile_url,
+            follower_count=account.follower_count,
         )
-    for account in user_in.weibo_accounts:
-        db.add(
-            WeiboAccount(
-                user_id=user_id,
-                account_name=account.account_name,
-                account_id=account.account_id,
-                profile_url=account.profile_url,
-                follower_count=account.follower_count,
-            )
+        for account in user_in.xiaohongshu_accounts
+    ]
+    user.weibo_accounts = [
+        WeiboAccount(
+            account_name=account.account_name,
+            account_id=account.account_id,
+            profile_url=account.profile_url,
+            follower_count=account.follower_count,
         )
+        for account in user_in.weibo_accounts
+    ]
 
 
 def _has_any_platform_account(user_in: UserCreate) -> bool:
     return bool(user_in.douyin_accounts or user_in.xiaohongshu_accounts or user_in.weibo_accounts)
 
 
-def _ensure_relations_loaded(user: User) -> None:
-    _ = user.douyin_accounts
-    _ = user.xiaohongshu_accounts
-    _ = user.weibo_accounts
-
-
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 def register_user(user_in: UserCreate, db: Session = Depends(get_db)) -> User:
     if not _has_any_platform_account(user_in):
@@ -75,15 +74,6 @@ def register_user(user_in: UserCreate, db: Session = Depends(get_db)) -> User:
             detail="At least one social platform account is required",
         )
 
-    existing_email = db.exec(select(User).where(User.email == user_in.email)).first()
-    if existing_email:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-
-    if user_in.phone:
-        existing_phone = db.exec(select(User).where(User.phone == user_in.phone)).first()
-        if existing_phone:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Phone already registered")
-
     user = User(
         email=user_in.email,
         phone=user_in.phone,
@@ -100,17 +90,24 @@ def register_user(user_in: UserCreate, db: Session = Depends(get_db)) -> User:
         is_active=True,
         review_status=ReviewStatus.pending,
         role=Role.blogger,
-        updated_at=datetime.utcnow(),
     )
 
+    _build_platform_accounts(user, user_in)
     db.add(user)
-    db.commit()
-    db.refresh(user)
-
-    _create_platform_accounts(db, user.id, user_in)
-    db.commit()
-    db.refresh(user)
-    _ensure_relations_loaded(user)
+    # The unique indexes on users.email / users.phone catch duplicates, including
+    # concurrent registrations that a lookup beforehand would let through.
+    try:
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        message = str(exc.orig)
+        if "users.email" not in message and "users.phone" not in message:
+            raise
+        # SQLite names whichever unique index it checks first, and that order follows index
+        # creation; when both collide, look up the email so it is always reported first.
+        if "users.email" in message or db.exec(select(User.id).where(User.email == user_in.email)).first():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Phone already registered")
     return user
 
 
@@ -142,6 +139,12 @@ def login_for_access_token(
             detail=f"Account review status: {user.review_status.value}",
         )
 
+    if password_needs_rehash(user.hashed_password):
+        # Migrate hashes created with older Argon2 parameters on successful login.
+        user.hashed_password = get_password_hash(form_data.password)
+        db.add(user)
+        db.commit()
+
     expires_delta = None
     if remember_me:
         expires_delta = timedelta(days=settings.remember_me_access_token_expire_days)
@@ -3,10 +3,14 @@ from __future__ import annotations
 from datetime import datetime
 
 from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from sqlalchemy import case
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, func, select
 
+from app.core.user_cache import AuthUser
+from app.db.loaders import strict_loads
 from app.dependencies import get_current_approved_blogger, get_db
-from app.models import Assignment, AssignmentStatus, MetricSyncStatus, Task, TaskStatus, User
+from app.models import Assignment, AssignmentStatus, MetricSyncStatus, Task, TaskStatus
 from app.schemas.dashboard import (
     BloggerDashboardRead,
     BloggerDashboardStatsRead,
@@ -16,8 +20,7 @@ from app.schemas.dashboard import (
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
-
-BLOGGER_FORMULAS = [
+BLOGGER_FORMULAS = (
     DashboardMetricFormulaRead(
         key="available_tasks",
         label="可用任务",
@@ -41,7 +44,7 @@ BLOGGER_FORMULAS = [
             "自动同步仅作预采集，手工审核通过后计入结算收益"
         ),
     ),
-]
+)
 
 
 def _to_activity_row(assignment: Assignment) -> DashboardActivityRead:
@@ -55,50 +58,52 @@ def _to_activity_row(assignment: Assignment) -> DashboardActivityRead:
     )
 
 
-def _is_revenue_verified(assignment: Assignment) -> bool:
-    return assignment.metric_sync_status == MetricSyncStatus.manual_approved
-
-
 @router.get("/blogger", response_model=BloggerDashboardRead)
 def get_blogger_dashboard(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_approved_blogger),
+    current_user: AuthUser = Depends(get_current_approved_blogger),
 ) -> BloggerDashboardRead:
-    assignments = db.exec(
+    recent_assignments = db.exec(
         select(Assignment)
+        .options(*strict_loads(joinedload(Assignment.task)))
         .where(Assignment.user_id == current_user.id)
         .order_by(Assignment.created_at.desc())
+        .limit(10)
     ).all()
-    available_tasks = db.exec(select(Task).where(Task.status == TaskStatus.published)).all()
-
-    accepted_count = 0
-    in_review_count = 0
-    completed_count = 0
-    rejected_count = 0
-    cancelled_count = 0
-    total_revenue = 0.0
-
-    for assignment in assignments:
-        if _is_revenue_verified(assignment):
-            total_revenue += float(assignment.revenue or 0.0)
-        if assignment.status == AssignmentStatus.accepted:
-            accepted_count += 1
-        elif assignment.status == AssignmentStatus.in_review:
-            in_review_count += 1
-        elif assignment.status == AssignmentStatus.completed:
-            completed_count += 1
-        elif assignment.status == AssignmentStatus.rejected:
-            rejected_count += 1
-        elif assignment.status == AssignmentStatus.cancelled:
-            cancelled_count += 1
-
+    status_rows = db.exec(
+        select(
+            Assignment.status,
+            func.count(),
+            func.coalesce(
+                func.sum(
+                    case(
+                        (Assignment.metric_sync_status == MetricSyncStatus.manual_approved, Assignment.revenue),
+                        else_=0.0,
+                    )
+                ),
+                0.0,
+            ),
+        )
+        .where(Assignment.user_id == current_user.id)
+        .group_by(Assignment.status)
+    ).all()
+    available_task_count = db.exec(
+        select(func.count()).select_from(Task).where(Task.status == TaskStatus.published)
+    ).one()
+
+    status_counts = {row_status: count for row_status, count, _ in status_rows}
+    total_revenue = sum(float(revenue) for _, _, revenue in status_rows)
+    accepted_count = status_counts.get(AssignmentStatus.accepted, 0)
+    in_review_count = status_counts.get(AssignmentStatus.in_review, 0)
+    completed_count = status_counts.get(AssignmentStatus.completed, 0)
+    rejected_count = status_counts.get(AssignmentStatus.rejected, 0)
+    cancelled_count = status_counts.get(AssignmentStatus.cancelled, 0)
     in_progress_count = accepted_count + in_review_count
-    recent_activities = [_to_activity_row(item) for item in assignments[:10]]
 
     return BloggerDashboardRead(
         generated_at=datetime.utcnow(),
         stats=BloggerDashboardStatsRead(
-            available_tasks=len(available_tasks),
+            available_tasks=available_task_count,
             in_progress_assignments=in_progress_count,
             completed_assignments=completed_count,
             total_revenue=round(total_revenue, 2),
@@ -107,6 +112,6 @@ def get_blogger_dashboard(
             rejected_assignments=rejected_count,
             cancelled_assignments=cancelled_count,
         ),
-        recent_activities=recent_activities,
+        recent_activities=[_to_activity_row(assignment) for assignment in recent_assignments],
         formulas=BLOGGER_FORMULAS,
     )
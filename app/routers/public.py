@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from functools import lru_cache
+
+from fastapi import APIRouter, Response
 
 from app.core.config import settings
 from app.schemas.public_config import HomepageConfigRead, OSSPublicConfigRead, PublicConfigRead
@@ -6,8 +8,22 @@ from app.schemas.public_config import HomepageConfigRead, OSSPublicConfigRead, P
 router = APIRouter(prefix="/public", tags=["public"])
 
 
+# Settings are fixed for the life of the process, so the body is serialized once.
+@lru_cache(maxsize=1)
+def _public_config_body() -> bytes:
+    return _build_public_config().model_dump_json().encode()
+
+
 @router.get("/config", response_model=PublicConfigRead)
-def get_public_config() -> PublicConfigRead:
+def get_public_config() -> Response:
+    return Response(
+        content=_public_config_body(),
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=60"},
+    )
+
+
+def _build_public_config() -> PublicConfigRead:
     return PublicConfigRead(
         homepage=HomepageConfigRead(
             site_name=settings.app_name,
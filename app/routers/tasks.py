@@ -6,8 +6,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func
 from sqlmodel import Session, select
 
+from app.core.user_cache import AuthUser
+from app.db.loaders import ACTIVE_ASSIGNMENT_COUNT, ASSIGNMENT_READ_LOADERS, strict_loads
 from app.dependencies import get_current_approved_blogger, get_db
-from app.models import Assignment, AssignmentStatus, Task, TaskStatus, User
+from app.models import Assignment, AssignmentStatus, Task, TaskStatus
 from app.schemas.assignment import AssignmentRead
 from app.schemas.task import TaskRead
 from app.services.activity import log_activity
@@ -15,25 +17,6 @@ from app.services.activity import log_activity
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
-def _ensure_assignment_relations_loaded(assignment: Assignment) -> None:
-    _ = assignment.task
-    _ = assignment.metrics
-    _ = assignment.manual_metric_submissions
-
-
-def _count_active_assignments_map(db: Session, task_ids: list[int]) -> dict[int, int]:
-    if not task_ids:
-        return {}
-
-    rows = db.exec(
-        select(Assignment.task_id, func.count(Assignment.id))
-        .where(Assignment.task_id.in_(task_ids))
-        .where(Assignment.status != AssignmentStatus.cancelled)
-        .group_by(Assignment.task_id)
-    ).all()
-    return {int(task_id): int(count) for task_id, count in rows}
-
-
 def _count_active_assignments(db: Session, task_id: int) -> int:
     count = db.exec(
         select(func.count(Assignment.id))
@@ -71,24 +54,22 @@ def _to_task_read(task: Task, accepted_count: int) -> TaskRead:
 @router.get("/", response_model=list[TaskRead])
 def list_tasks(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_approved_blogger),
+    current_user: AuthUser = Depends(get_current_approved_blogger),
 ) -> list[TaskRead]:
     del current_user
-    tasks = db.exec(
-        select(Task)
+    rows = db.exec(
+        select(Task, ACTIVE_ASSIGNMENT_COUNT)
         .where(Task.status == TaskStatus.published)
         .order_by(Task.created_at.desc())
     ).all()
-    task_ids = [task.id for task in tasks if task.id is not None]
-    count_map = _count_active_assignments_map(db, task_ids)
-    return [_to_task_read(task, count_map.get(task.id or 0, 0)) for task in tasks]
+    return [_to_task_read(task, accepted_count) for task, accepted_count in rows]
 
 
 @router.get("/{task_id}", response_model=TaskRead)
 def get_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_approved_blogger),
+    current_user: AuthUser = Depends(get_current_approved_blogger),
 ) -> TaskRead:
     del current_user
     task = db.get(Task, task_id)
@@ -101,7 +82,7 @@ def get_task(
 def accept_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_approved_blogger),
+    current_user: AuthUser = Depends(get_current_approved_blogger),
 ) -> Assignment:
     task = db.get(Task, task_id)
     if not task or task.status != TaskStatus.published:
@@ -109,12 +90,12 @@ def accept_task(
 
     existing = db.exec(
         select(Assignment)
+        .options(*strict_loads(*ASSIGNMENT_READ_LOADERS))
         .where(Assignment.task_id == task_id)
         .where(Assignment.user_id == current_user.id)
         .where(Assignment.status != AssignmentStatus.cancelled)
     ).first()
     if existing:
-        _ensure_assignment_relations_loaded(existing)
         return existing
 
     current_active = _count_active_assignments(db, task_id)
@@ -124,13 +105,17 @@ def accept_task(
             detail="Task acceptance limit reached",
         )
 
+    now = datetime.utcnow()
     assignment = Assignment(
         task_id=task_id,
         user_id=current_user.id,
         status=AssignmentStatus.accepted,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
     )
+    # A new row has no metrics yet; populate the relations AssignmentRead needs without a reload.
+    assignment.task = task
+    assignment.metrics = []
+    assignment.manual_metric_submissions = []
     db.add(assignment)
     log_activity(
         db,
@@ -138,8 +123,7 @@ def accept_task(
         action_type="task_accept",
         title="接受任务",
         detail=f"任务ID: {task.id} / {task.title}",
+        created_at=now,
     )
     db.commit()
-    db.refresh(assignment)
-    _ensure_assignment_relations_loaded(assignment)
     return assignment
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import logging
 from typing import Type
@@ -8,6 +9,7 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile,
 from sqlmodel import Session, select
 
 from app.core.security import get_password_hash, verify_password
+from app.db.loaders import USER_ACCOUNT_LOADERS, strict_loads
 from app.dependencies import get_current_active_user, get_db
 from app.models import (
     DouyinAccount,
@@ -33,6 +35,7 @@ from app.schemas.user import (
     UserRead,
 )
 from app.services.activity import log_activity
+from app.services.distribution import invalidate_eligible_bloggers_cache
 from app.services.oss import OSSConfigError, upload_payout_qr_code
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -42,11 +45,14 @@ logger = logging.getLogger(__name__)
 PlatformModel = Type[DouyinAccount] | Type[XiaohongshuAccount] | Type[WeiboAccount]
 
 
-def _ensure_relations_loaded(user: User) -> None:
-    _ = user.douyin_accounts
-    _ = user.xiaohongshu_accounts
-    _ = user.weibo_accounts
-    _ = user.payout_info
+def _load_user_read(db: Session, user_id: int) -> User:
+    # get_current_active_user loads the bare row; reload it with the collections UserRead needs.
+    return db.get(
+        User,
+        user_id,
+        options=strict_loads(*USER_ACCOUNT_LOADERS),
+        populate_existing=True,
+    )
 
 
 def _resolve_platform_model(platform: SocialPlatform) -> PlatformModel:
@@ -128,9 +134,11 @@ def _legacy_payout_fields(payload: PayoutInfoUpsert) -> dict[str, str | None]:
 
 
 @router.get("/me", response_model=UserRead)
-def read_current_user(current_user: User = Depends(get_current_active_user)) -> User:
-    _ensure_relations_loaded(current_user)
-    return current_user
+def read_current_user(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+) -> User:
+    return _load_user_read(db, current_user.id)
 
 
 @router.patch("/me/profile", response_model=UserRead)
@@ -141,8 +149,7 @@ def update_current_user_profile(
 ) -> User:
     updates = payload.model_dump(exclude_unset=True)
     if not updates:
-        _ensure_relations_loaded(current_user)
-        return current_user
+        return _load_user_read(db, current_user.id)
 
     for field_name, value in updates.items():
         if field_name == "tags" and value is not None:
@@ -150,7 +157,6 @@ def update_current_user_profile(
         else:
             setattr(current_user, field_name, value)
 
-    current_user.updated_at = datetime.utcnow()
     db.add(current_user)
     log_activity(
         db,
@@ -160,9 +166,8 @@ def update_current_user_profile(
         detail="更新了基础资料信息",
     )
     db.commit()
-    db.refresh(current_user)
-    _ensure_relations_loaded(current_user)
-    return current_user
+    invalidate_eligible_bloggers_cache()
+    return _load_user_read(db, current_user.id)
 
 
 @router.post(
@@ -194,6 +199,7 @@ def add_platform_account(
     )
     db.add(account)
 
+    # Only the account row is written, so the owner's updated_at is stamped by hand.
     current_user.updated_at = datetime.utcnow()
     db.add(current_user)
     log_activity(
@@ -204,7 +210,7 @@ def add_platform_account(
         detail=f"账号ID: {payload.account_id}",
     )
     db.commit()
-    db.refresh(account)
+    invalidate_eligible_bloggers_cache()
     return PlatformAccountRead.model_validate(account)
 
 
@@ -253,7 +259,7 @@ def update_platform_account(
         detail=f"账号ID: {account.account_id}",
     )
     db.commit()
-    db.refresh(account)
+    invalidate_eligible_bloggers_cache()
     return PlatformAccountRead.model_validate(account)
 
 
@@ -292,6 +298,7 @@ def delete_platform_account(
         detail=f"账号ID: {deleted_account_id}",
     )
     db.commit()
+    invalidate_eligible_bloggers_cache()
 
 
 @router.get("/me/social-accounts", response_model=list[SocialAccountRead])
@@ -315,7 +322,6 @@ def change_password(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="New password must be different")
 
     current_user.hashed_password = get_password_hash(payload.new_password)
-    current_user.updated_at = datetime.utcnow()
     db.add(current_user)
     log_activity(
         db,
@@ -349,7 +355,6 @@ def upsert_my_payout_info(
     else:
         for field_name, value in updates.items():
             setattr(payout, field_name, value)
-        payout.updated_at = datetime.utcnow()
 
     db.add(payout)
     log_activity(
@@ -360,7 +365,6 @@ def upsert_my_payout_info(
         detail=f"收款方式: {payload.payout_method.value}",
     )
     db.commit()
-    db.refresh(payout)
     return payout
 
 
@@ -383,7 +387,8 @@ async def upload_my_payout_qr_code(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid filename")
 
     try:
-        url, object_key = upload_payout_qr_code(
+        url, object_key = await asyncio.to_thread(
+            upload_payout_qr_code,
             file=file,
             user_id=current_user.id,
             method=method.value,
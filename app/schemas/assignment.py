@@ -47,6 +47,19 @@ class AssignmentReject(SQLModel):
     reason: str
 
 
+class AssignmentBulkApprove(SQLModel):
+    ids: list[int] = Field(min_length=1, max_length=500)
+
+
+class AssignmentBulkReject(AssignmentBulkApprove):
+    reason: str
+
+
+class AssignmentBulkResultRead(SQLModel):
+    updated_ids: list[int]
+    skipped_ids: list[int]
+
+
 class AssignmentRead(SQLModel):
     id: int
     status: AssignmentStatus
@@ -45,6 +45,15 @@ class TaskRead(SQLModel):
     updated_at: datetime
 
 
+class TaskBulkAction(SQLModel):
+    ids: list[int] = Field(min_length=1, max_length=500)
+
+
+class TaskBulkResultRead(SQLModel):
+    updated_ids: list[int]
+    skipped_ids: list[int]
+
+
 class EligibleBloggerRead(SQLModel):
     user_id: int
     username: str
@@ -120,6 +120,15 @@ class UserReviewUpdate(SQLModel):
     review_reason: Optional[str] = None
 
 
+class UserBulkReviewUpdate(UserReviewUpdate):
+    ids: list[int] = Field(min_length=1, max_length=500)
+
+
+class UserBulkResultRead(SQLModel):
+    updated_ids: list[int]
+    skipped_ids: list[int]
+
+
 class UserWeightUpdate(SQLModel):
     weight: float = Field(gt=0)
 
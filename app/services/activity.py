@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlmodel import Session
 
 from app.models import UserActivityLog
@@ -10,12 +12,15 @@ def log_activity(
     action_type: str,
     title: str,
     detail: str | None = None,
+    created_at: datetime | None = None,
 ) -> None:
-    session.add(
-        UserActivityLog(
-            user_id=user_id,
-            action_type=action_type,
-            title=title,
-            detail=detail,
-        )
+    entry = UserActivityLog(
+        user_id=user_id,
+        action_type=action_type,
+        title=title,
+        detail=detail,
     )
+    # Lets a mutation stamp its log entry with the same instant as the row it changed.
+    if created_at is not None:
+        entry.created_at = created_at
+    session.add(entry)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Type
+from functools import lru_cache
+import threading
+from typing import Any, Type
 
-from sqlmodel import Session, select
+from cachetools import TTLCache
+from sqlmodel import Session, func, select
 
 from app.models import (
     Assignment,
@@ -33,7 +36,22 @@ _PLATFORM_ALIASES = {
     "wb": SocialPlatform.weibo,
 }
 
+# Admin preview forms re-query on every input change; the eligible set only moves when
+# bloggers are reviewed, reweighted or relink accounts, and those paths invalidate.
+ELIGIBLE_CACHE_TTL_SECONDS = 30
 
+_ELIGIBLE_ORDER = (
+    User.weight.desc(),
+    User.avg_views.desc(),
+    User.follower_total.desc(),
+    User.id,
+)
+
+_eligible_cache: TTLCache = TTLCache(maxsize=128, ttl=ELIGIBLE_CACHE_TTL_SECONDS)
+_eligible_lock = threading.Lock()
+
+
+@lru_cache(maxsize=64)
 def normalize_platform(platform: str) -> SocialPlatform | None:
     return _PLATFORM_ALIASES.get(platform.strip().lower()) or _PLATFORM_ALIASES.get(platform.strip())
 
@@ -46,29 +64,62 @@ def _resolve_platform_model(platform: SocialPlatform) -> PlatformModel:
     return WeiboAccount
 
 
-def list_eligible_bloggers(session: Session, task: Task) -> list[User]:
-    platform = normalize_platform(task.platform)
-
-    base_users = session.exec(
-        select(User)
-        .where(User.role == Role.blogger)
+def _eligible_bloggers_where(statement, task: Task):
+    statement = (
+        statement.where(User.role == Role.blogger)
         .where(User.is_active.is_(True))
         .where(User.review_status == ReviewStatus.approved)
-    ).all()
+    )
+    platform = normalize_platform(task.platform)
+    if platform is not None:
+        model = _resolve_platform_model(platform)
+        # Correlated EXISTS lets SQLite walk users in ranking order and stop at the LIMIT,
+        # where IN (subquery) drives the plan from the account table and sorts everything.
+        statement = statement.where(select(model.id).where(model.user_id == User.id).exists())
+    return statement
 
-    if platform is None:
-        return sorted(
-            base_users,
-            key=lambda user: (-user.weight, -user.avg_views, -user.follower_total, user.id or 0),
-        )
 
-    model = _resolve_platform_model(platform)
-    supported_ids = set(session.exec(select(model.user_id)).all())
-    users = [user for user in base_users if user.id in supported_ids]
-    return sorted(
-        users,
-        key=lambda user: (-user.weight, -user.avg_views, -user.follower_total, user.id or 0),
-    )
+def count_eligible_bloggers(session: Session, task: Task) -> int:
+    return session.exec(_eligible_bloggers_where(select(func.count()).select_from(User), task)).one()
+
+
+def list_eligible_bloggers(session: Session, task: Task, *, limit: int | None = None) -> list[User]:
+    statement = _eligible_bloggers_where(select(User), task).order_by(*_ELIGIBLE_ORDER)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return list(session.exec(statement).all())
+
+
+def invalidate_eligible_bloggers_cache() -> None:
+    with _eligible_lock:
+        _eligible_cache.clear()
+
+
+def get_eligible_bloggers_preview(session: Session, task: Task, *, limit: int) -> tuple[int, tuple[Any, ...]]:
+    # Eligibility depends only on the platform, so tasks sharing one share the entry.
+    # Rows carry plain column values, never ORM objects bound to another session.
+    platform = normalize_platform(task.platform)
+    key = (platform.value if platform is not None else None, limit)
+    with _eligible_lock:
+        cached = _eligible_cache.get(key)
+    if cached is not None:
+        return cached
+
+    statement = _eligible_bloggers_where(
+        select(
+            User.id,
+            User.username,
+            User.display_name,
+            User.follower_total,
+            User.avg_views,
+            User.weight,
+        ),
+        task,
+    ).order_by(*_ELIGIBLE_ORDER)
+    preview = (count_eligible_bloggers(session, task), tuple(session.exec(statement.limit(limit)).all()))
+    with _eligible_lock:
+        _eligible_cache[key] = preview
+    return preview
 
 
 def distribute_task(
@@ -77,36 +128,44 @@ def distribute_task(
     *,
     target_user_ids: list[int],
 ) -> tuple[int, int]:
-    created_count = 0
-    skipped_existing_count = 0
+    # One lookup for every target instead of a SELECT per user; the ORM flush then
+    # sends the new rows as a batched multi-row INSERT.
+    assigned_user_ids: set[int] = set()
+    if target_user_ids:
+        assigned_user_ids = set(
+            session.exec(
+                select(Assignment.user_id)
+                .where(Assignment.task_id == task.id)
+                .where(Assignment.user_id.in_(target_user_ids))
+                .where(Assignment.status != AssignmentStatus.cancelled)
+            ).all()
+        )
 
+    now = datetime.utcnow()
+    new_assignments: list[Assignment] = []
+    skipped_existing_count = 0
     for user_id in target_user_ids:
-        existing = session.exec(
-            select(Assignment)
-            .where(Assignment.task_id == task.id)
-            .where(Assignment.user_id == user_id)
-            .where(Assignment.status != AssignmentStatus.cancelled)
-        ).first()
-        if existing:
+        if user_id in assigned_user_ids:
             skipped_existing_count += 1
             continue
 
-        session.add(
+        assigned_user_ids.add(user_id)
+        new_assignments.append(
             Assignment(
                 task_id=task.id,
                 user_id=user_id,
                 status=AssignmentStatus.accepted,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
             )
         )
-        created_count += 1
         log_activity(
             session,
             user_id=user_id,
             action_type="task_assigned",
             title="任务已分配",
             detail=f"任务ID: {task.id} / {task.title}",
+            created_at=now,
         )
 
-    return created_count, skipped_existing_count
+    session.add_all(new_assignments)
+    return len(new_assignments), skipped_existing_count
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
+import threading
 import uuid
 from datetime import datetime
+from typing import BinaryIO
 from urllib.parse import quote
 
 from fastapi import UploadFile
@@ -15,6 +17,11 @@ except ImportError:  # pragma: no cover - validated during runtime usage
     oss2 = None
 
 
+# Uploads run in worker threads; cap how many PUTs are in flight at once.
+MAX_CONCURRENT_UPLOADS = 4
+_upload_slots = threading.BoundedSemaphore(MAX_CONCURRENT_UPLOADS)
+
+
 class OSSConfigError(RuntimeError):
     pass
 
@@ -105,7 +112,7 @@ def _should_retry_with_http(exc: Exception) -> bool:
 def _upload_payload(
     *,
     object_key: str,
-    payload: bytes,
+    payload: BinaryIO,
     content_type: str | None = None,
 ) -> tuple[str, str]:
     headers = {}
@@ -122,21 +129,24 @@ def _upload_payload(
     ]
     failure_messages: list[str] = []
     result = None
-    for attempt in attempts:
-        mode = f"{'http' if attempt['force_http'] else 'https'}|{'path' if attempt['is_path_style'] else 'virtual'}"
-        try:
-            bucket = _build_bucket(
-                force_http=attempt["force_http"],
-                is_path_style=attempt["is_path_style"],
-            )
-            result = bucket.put_object(object_key, payload, headers=headers or None)
-            used_http_fallback = attempt["force_http"]
-            break
-        except Exception as exc:
-            last_exc = exc
-            failure_messages.append(f"{mode}: {exc}")
-            if not _should_retry_with_http(exc):
-                raise
+    with _upload_slots:
+        for attempt in attempts:
+            mode = f"{'http' if attempt['force_http'] else 'https'}|{'path' if attempt['is_path_style'] else 'virtual'}"
+            try:
+                bucket = _build_bucket(
+                    force_http=attempt["force_http"],
+                    is_path_style=attempt["is_path_style"],
+                )
+                # oss2 streams file objects in chunks; rewind so a retry resends from the start.
+                payload.seek(0)
+                result = bucket.put_object(object_key, payload, headers=headers or None)
+                used_http_fallback = attempt["force_http"]
+                break
+            except Exception as exc:
+                last_exc = exc
+                failure_messages.append(f"{mode}: {exc}")
+                if not _should_retry_with_http(exc):
+                    raise
 
     if result is None and last_exc is not None:
         raise RuntimeError("OSS 多策略上传失败: " + " ; ".join(failure_messages)) from last_exc
@@ -150,11 +160,9 @@ def _upload_payload(
 def upload_task_attachment(file: UploadFile) -> tuple[str, str]:
     folder = settings.aliyun_oss_task_attachment_dir.strip("/") or "task-attachments"
     object_key = _build_object_key(file.filename, folder=folder)
-    file.file.seek(0)
-    payload = file.file.read() or b""
     return _upload_payload(
         object_key=object_key,
-        payload=payload,
+        payload=file.file,
         content_type=file.content_type,
     )
 
@@ -169,10 +177,8 @@ def upload_payout_qr_code(
     safe_method = method if method in {"wechat_pay", "alipay"} else "other"
     target_folder = "/".join([folder, safe_method, f"user-{user_id}"])
     object_key = _build_object_key(file.filename, folder=target_folder)
-    file.file.seek(0)
-    payload = file.file.read() or b""
     return _upload_payload(
         object_key=object_key,
-        payload=payload,
+        payload=file.file,
         content_type=file.content_type,
     )
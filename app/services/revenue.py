@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 
+from cachetools import TTLCache
 from sqlmodel import Session, select
 
 from app.models import Metric, PlatformMetricConfig
@@ -16,7 +18,31 @@ class RevenueConfig:
     view_weight: float = 0.01
 
 
+REVENUE_CONFIG_CACHE_TTL_SECONDS = 60
+
+_config_cache: TTLCache = TTLCache(maxsize=32, ttl=REVENUE_CONFIG_CACHE_TTL_SECONDS)
+_config_lock = threading.RLock()
+
+
+def invalidate_revenue_config_cache() -> None:
+    # Any platform may fall back to "default", so an upsert clears every entry.
+    with _config_lock:
+        _config_cache.clear()
+
+
 def get_revenue_config(session: Session, platform: str) -> RevenueConfig:
+    with _config_lock:
+        cached = _config_cache.get(platform)
+    if cached is not None:
+        return cached
+
+    config = _load_revenue_config(session, platform)
+    with _config_lock:
+        _config_cache[platform] = config
+    return config
+
+
+def _load_revenue_config(session: Session, platform: str) -> RevenueConfig:
     platform_config = session.exec(
         select(PlatformMetricConfig).where(PlatformMetricConfig.platform == platform)
     ).first()
@@ -8,6 +8,20 @@ from app.models import Assignment, AssignmentStatus, MetricSyncStatus
 from app.services.sync import sync_assignment_metrics_once
 
 
+def _load_syncable_assignments(session: Session) -> list[Assignment]:
+    return list(
+        session.exec(
+            select(Assignment).where(
+                Assignment.status == AssignmentStatus.in_review,
+                Assignment.metric_sync_status.in_([
+                    MetricSyncStatus.normal,
+                    MetricSyncStatus.manual_required,
+                ]),
+            )
+        ).all()
+    )
+
+
 async def metrics_update_loop(stop_event: asyncio.Event) -> None:
     interval = settings.metrics_update_interval_seconds
     if interval <= 0:
@@ -16,20 +30,13 @@ async def metrics_update_loop(stop_event: asyncio.Event) -> None:
     try:
         while not stop_event.is_set():
             with Session(engine) as session:
-                assignments = session.exec(
-                    select(Assignment).where(
-                        Assignment.status == AssignmentStatus.in_review,
-                        Assignment.metric_sync_status.in_([
-                            MetricSyncStatus.normal,
-                            MetricSyncStatus.manual_required,
-                        ]),
-                    )
-                ).all()
+                # SQLite calls run in a worker thread so the loop keeps serving requests.
+                assignments = await asyncio.to_thread(_load_syncable_assignments, session)
 
                 for assignment in assignments:
                     await sync_assignment_metrics_once(session, assignment)
 
-                session.commit()
+                await asyncio.to_thread(session.commit)
 
             try:
                 await asyncio.wait_for(stop_event.wait(), timeout=interval)
@@ -25,7 +25,6 @@ async def sync_assignment_metrics_once(session: Session, assignment: Assignment)
     if not assignment.post_link:
         assignment.metric_sync_status = MetricSyncStatus.manual_required
         assignment.last_sync_error = "Post link is missing"
-        assignment.updated_at = datetime.utcnow()
         return False, assignment.last_sync_error
 
     try:
@@ -33,7 +32,6 @@ async def sync_assignment_metrics_once(session: Session, assignment: Assignment)
     except Exception as exc:
         assignment.metric_sync_status = MetricSyncStatus.manual_required
         assignment.last_sync_error = str(exc)
-        assignment.updated_at = datetime.utcnow()
         return False, assignment.last_sync_error
 
     metric = Metric(
@@ -47,8 +45,8 @@ async def sync_assignment_metrics_once(session: Session, assignment: Assignment)
     session.add(metric)
     assignment.metric_sync_status = MetricSyncStatus.normal
     assignment.last_sync_error = None
-    assignment.last_synced_at = datetime.utcnow()
-    assignment.updated_at = datetime.utcnow()
+    now = datetime.utcnow()
+    assignment.last_synced_at = now
     return True, None
 
 
@@ -60,6 +58,7 @@ def apply_manual_metric(
     favorites: int,
     shares: int,
     views: int,
+    now: datetime | None = None,
 ) -> Metric:
     metric = Metric(
         assignment_id=assignment.id,
@@ -87,6 +86,6 @@ def apply_manual_metric(
     )
     assignment.metric_sync_status = MetricSyncStatus.manual_approved
     assignment.last_sync_error = None
-    assignment.last_synced_at = datetime.utcnow()
-    assignment.updated_at = datetime.utcnow()
+    now = now or datetime.utcnow()
+    assignment.last_synced_at = now
     return metric
@@ -41,7 +41,7 @@
 
     async function loadDashboard(showSuccess = false) {
         adminLayout.clearAlert();
-        adminSummary = await apiRequest("/admin/dashboard");
+        adminSummary = await apiRequest(showSuccess ? "/admin/dashboard?refresh=true" : "/admin/dashboard");
         renderSummary();
         if (showSuccess) {
             adminLayout.showAlert("总览数据已刷新", "success");
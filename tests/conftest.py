@@ -0,0 +1,110 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine
+
+from app.core import user_cache
+from app.core.security import create_access_token, get_password_hash
+from app.db import database
+from app.main import app
+from app.models import Assignment, ReviewStatus, Role, Task, TaskStatus, User
+from app.routers import admin as admin_router
+from app.routers import assignments as assignments_router
+from app.services import distribution, revenue
+
+_PASSWORD_HASH = get_password_hash("password")
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    # One in-memory database per test, shared by the TestClient threadpool.
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(assignments_router, "engine", engine)
+    database.create_db_and_tables()
+
+    user_cache._cache.clear()
+    admin_router._dashboard_cache.clear()
+    distribution.invalidate_eligible_bloggers_cache()
+    revenue.invalidate_revenue_config_cache()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def client(engine):
+    # No context manager: the lifespan seeding and the metrics loop stay off.
+    return TestClient(app)
+
+
+@pytest.fixture
+def make_user(db):
+    counter = iter(range(1, 1_000_000))
+
+    def _make_user(**fields) -> User:
+        n = next(counter)
+        fields.setdefault("email", f"user{n}@example.com")
+        fields.setdefault("username", f"user{n}")
+        fields.setdefault("hashed_password", _PASSWORD_HASH)
+        fields.setdefault("review_status", ReviewStatus.approved)
+        user = User(**fields)
+        db.add(user)
+        db.commit()
+        return user
+
+    return _make_user
+
+
+@pytest.fixture
+def make_task(db):
+    def _make_task(**fields) -> Task:
+        fields.setdefault("title", "task")
+        fields.setdefault("description", "description")
+        fields.setdefault("platform", "douyin")
+        fields.setdefault("instructions", "instructions")
+        fields.setdefault("status", TaskStatus.published)
+        task = Task(**fields)
+        db.add(task)
+        db.commit()
+        return task
+
+    return _make_task
+
+
+@pytest.fixture
+def make_assignment(db):
+    def _make_assignment(task: Task, user: User, **fields) -> Assignment:
+        assignment = Assignment(task_id=task.id, user_id=user.id, **fields)
+        db.add(assignment)
+        db.commit()
+        return assignment
+
+    return _make_assignment
+
+
+@pytest.fixture
+def admin(make_user) -> User:
+    return make_user(role=Role.admin)
+
+
+@pytest.fixture
+def auth_headers():
+    def _auth_headers(user: User) -> dict[str, str]:
+        token = create_access_token({"sub": str(user.id), "role": user.role.value})
+        return {"Authorization": f"Bearer {token}"}
+
+    return _auth_headers
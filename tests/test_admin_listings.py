@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.models import DouyinAccount, ReviewStatus
+
+ADMIN_URL = "/api/v1/admin"
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_list_users_includes_accounts_and_total(monkeypatch, db, client, admin, auth_headers, make_user, debug):
+    # Debug mode makes strict_loads raise on any relationship the listing forgot to eager-load.
+    monkeypatch.setattr(settings, "debug", debug)
+    bloggers = [make_user(review_status=ReviewStatus.pending) for _ in range(3)]
+    db.add(DouyinAccount(user_id=bloggers[0].id, account_name="dy", account_id="dy-1", follower_count=5))
+    db.commit()
+
+    response = client.get(
+        f"{ADMIN_URL}/users",
+        params={"review_status": "pending", "limit": 2},
+        headers=auth_headers(admin),
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "3"
+    assert len(response.json()) == 2
+
+    everyone = client.get(f"{ADMIN_URL}/users", params={"review_status": "pending"}, headers=auth_headers(admin))
+    accounts = {user["id"]: user["douyin_accounts"] for user in everyone.json()}
+    assert [account["account_id"] for account in accounts[bloggers[0].id]] == ["dy-1"]
+    assert accounts[bloggers[1].id] == []
+
+
+def test_platform_configs_revalidate_without_loading_rows(engine, db, client, admin, auth_headers):
+    url = f"{ADMIN_URL}/platform-configs"
+    headers = auth_headers(admin)
+    client.put(f"{url}/douyin", json={"platform_coef": 1.5}, headers=headers)
+
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        revalidated = client.get(url, headers={**headers, "If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    config_selects = [sql for sql in statements if "platform_metric_configs" in sql]
+    assert len(config_selects) == 1 and "max(" in config_selects[0]
+
+    client.put(f"{url}/douyin", json={"platform_coef": 2.0}, headers=headers)
+    changed = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()[0]["platform_coef"] == 2.0
@@ -0,0 +1,51 @@
+import pytest
+
+from app.db import database
+from app.models import AssignmentStatus, MetricSyncStatus
+from app.routers import admin as admin_router
+
+
+def _dashboard_figures(client, headers):
+    response = client.get("/api/v1/admin/dashboard", params={"refresh": True}, headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    return body["assignment_stats"], body["revenue"]
+
+
+@pytest.fixture
+def assignments(db, make_user, make_task, make_assignment):
+    alice, bob = make_user(), make_user()
+    task = make_task()
+    make_assignment(task, alice, status=AssignmentStatus.completed,
+                    metric_sync_status=MetricSyncStatus.manual_approved, revenue=12.0)
+    make_assignment(task, bob, status=AssignmentStatus.completed, revenue=4.0)
+    make_assignment(task, bob, status=AssignmentStatus.in_review)
+    rejected = make_assignment(task, alice, status=AssignmentStatus.accepted)
+    rejected.status = AssignmentStatus.rejected
+    db.add(rejected)
+    db.commit()
+    cancelled = make_assignment(task, bob)
+    db.delete(cancelled)
+    db.commit()
+
+
+def test_rollup_matches_group_by_fallback(monkeypatch, client, admin, auth_headers, assignments):
+    from_rollup = _dashboard_figures(client, auth_headers(admin))
+    monkeypatch.setattr(admin_router, "_uses_sqlite_triggers", lambda db: False)
+    from_group_by = _dashboard_figures(client, auth_headers(admin))
+
+    assert from_rollup == from_group_by
+    stats, revenue = from_rollup
+    assert stats["total"] == 4
+    assert stats["completed"] == 2
+    assert revenue["completed_revenue"] == pytest.approx(12.0)
+
+
+def test_empty_rollup_is_backfilled_on_start(engine, client, admin, auth_headers, assignments):
+    expected = _dashboard_figures(client, auth_headers(admin))
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM assignment_status_stats")
+
+    database.create_db_and_tables()
+
+    assert _dashboard_figures(client, auth_headers(admin)) == expected
@@ -0,0 +1,111 @@
+from sqlmodel import select
+
+from app.models import (
+    AssignmentStatus,
+    MetricSyncStatus,
+    ReviewStatus,
+    Task,
+    TaskStatus,
+    User,
+    UserActivityLog,
+)
+
+ADMIN_URL = "/api/v1/admin"
+
+
+def test_bulk_review_moves_only_allowed_users(db, client, admin, auth_headers, make_user):
+    pending = make_user(review_status=ReviewStatus.pending)
+    approved = make_user(review_status=ReviewStatus.approved)
+    under_review = make_user(review_status=ReviewStatus.under_review)
+
+    response = client.post(
+        f"{ADMIN_URL}/users/bulk-review",
+        json={
+            "ids": [pending.id, under_review.id, approved.id, admin.id, 9999, pending.id],
+            "review_status": "under_review",
+        },
+        headers=auth_headers(admin),
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "updated_ids": [pending.id, approved.id],
+        "skipped_ids": [under_review.id, admin.id, 9999],
+    }
+    statuses = dict(db.exec(select(User.id, User.review_status)).all())
+    assert statuses[pending.id] == statuses[approved.id] == ReviewStatus.under_review
+    assert statuses[admin.id] == ReviewStatus.approved
+
+    details = db.exec(
+        select(UserActivityLog.detail).where(UserActivityLog.action_type == "admin_user_review")
+    ).all()
+    assert sorted(detail.split("; ")[1] for detail in details) == [
+        "状态: approved -> under_review",
+        "状态: pending -> under_review",
+    ]
+
+
+def test_bulk_reject_requires_reason(client, admin, auth_headers, make_user):
+    user = make_user(review_status=ReviewStatus.under_review)
+    response = client.post(
+        f"{ADMIN_URL}/users/bulk-review",
+        json={"ids": [user.id], "review_status": "rejected"},
+        headers=auth_headers(admin),
+    )
+    assert response.status_code == 422
+
+
+def test_bulk_review_takes_effect_immediately(client, admin, auth_headers, make_user):
+    blogger = make_user()
+    assert client.get("/api/v1/tasks/", headers=auth_headers(blogger)).status_code == 200
+
+    response = client.post(
+        f"{ADMIN_URL}/users/bulk-review",
+        json={"ids": [blogger.id], "review_status": "under_review"},
+        headers=auth_headers(admin),
+    )
+    assert response.json()["updated_ids"] == [blogger.id]
+
+    assert client.get("/api/v1/tasks/", headers=auth_headers(blogger)).status_code == 403
+
+
+def test_bulk_publish_and_cancel_tasks(db, client, admin, auth_headers, make_task):
+    draft = make_task(status=TaskStatus.draft)
+    published = make_task(status=TaskStatus.published)
+
+    response = client.post(
+        f"{ADMIN_URL}/tasks/bulk-publish", json={"ids": [draft.id, published.id, 9999]}, headers=auth_headers(admin)
+    )
+    assert response.json() == {"updated_ids": [draft.id], "skipped_ids": [published.id, 9999]}
+
+    response = client.post(
+        f"{ADMIN_URL}/tasks/bulk-cancel", json={"ids": [draft.id, published.id]}, headers=auth_headers(admin)
+    )
+    assert response.json() == {"updated_ids": [draft.id, published.id], "skipped_ids": []}
+    assert set(db.exec(select(Task.status)).all()) == {TaskStatus.cancelled}
+
+
+def test_bulk_approve_and_reject_assignments(
+    db, client, admin, auth_headers, make_user, make_task, make_assignment
+):
+    blogger = make_user()
+    task = make_task()
+    ready = make_assignment(task, blogger, status=AssignmentStatus.in_review,
+                            metric_sync_status=MetricSyncStatus.manual_approved, revenue=8.0)
+    unverified = make_assignment(task, blogger, status=AssignmentStatus.in_review)
+    accepted = make_assignment(task, blogger)
+
+    response = client.post(
+        f"{ADMIN_URL}/assignments/bulk-approve",
+        json={"ids": [ready.id, unverified.id, accepted.id]},
+        headers=auth_headers(admin),
+    )
+    assert response.json() == {"updated_ids": [ready.id], "skipped_ids": [unverified.id, accepted.id]}
+    assert db.exec(select(User.total_revenue).where(User.id == blogger.id)).one() == 8.0
+
+    response = client.post(
+        f"{ADMIN_URL}/assignments/bulk-reject",
+        json={"ids": [ready.id, unverified.id], "reason": "blurry"},
+        headers=auth_headers(admin),
+    )
+    assert response.json() == {"updated_ids": [unverified.id], "skipped_ids": [ready.id]}
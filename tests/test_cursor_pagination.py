@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from app.models import ManualMetricSubmission
+
+ADMIN_URL = "/api/v1/admin"
+SAME_INSTANT = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _page_all(client, url, headers, cursor_params, page_size=2):
+    pages, params = [], {"limit": page_size}
+    while True:
+        rows = client.get(url, params=params, headers=headers).json()
+        if not rows:
+            return pages
+        pages.append([row["id"] for row in rows])
+        params = {"limit": page_size, **cursor_params(rows[-1])}
+
+
+def test_task_cursor_walks_ties_without_gaps(client, admin, auth_headers, make_task):
+    # Several tasks share created_at, so the id must break the tie on page boundaries.
+    for index in range(7):
+        created_at = SAME_INSTANT if index % 2 else datetime(2026, 1, index + 1)
+        make_task(title=f"task {index}", created_at=created_at)
+    url = f"{ADMIN_URL}/tasks"
+    headers = auth_headers(admin)
+
+    everything = [row["id"] for row in client.get(url, headers=headers).json()]
+    pages = _page_all(client, url, headers, lambda last: {"before": last["created_at"], "before_id": last["id"]})
+
+    assert [task_id for page in pages for task_id in page] == everything
+    assert len(everything) == 7
+    assert all(len(page) <= 2 for page in pages)
+
+
+def test_task_cursor_total_counts_remaining_rows(client, admin, auth_headers, make_task):
+    tasks = [make_task(created_at=SAME_INSTANT) for _ in range(5)]
+    url = f"{ADMIN_URL}/tasks"
+    headers = auth_headers(admin)
+
+    first = client.get(url, params={"limit": 2}, headers=headers)
+    assert first.headers["X-Total-Count"] == "5"
+    last = first.json()[-1]
+    second = client.get(
+        url, params={"limit": 2, "before": last["created_at"], "before_id": last["id"]}, headers=headers
+    )
+    assert second.headers["X-Total-Count"] == "3"
+    assert [row["id"] for row in second.json()] == [tasks[2].id, tasks[1].id]
+
+
+def test_pending_manual_metric_cursor(db, client, admin, auth_headers, make_user, make_task, make_assignment):
+    assignment = make_assignment(make_task(), make_user())
+    for index in range(5):
+        db.add(ManualMetricSubmission(assignment_id=assignment.id, likes=index, submitted_at=SAME_INSTANT))
+    db.commit()
+    url = f"{ADMIN_URL}/manual-metrics/pending"
+    headers = auth_headers(admin)
+
+    everything = [row["id"] for row in client.get(url, headers=headers).json()]
+    pages = _page_all(client, url, headers, lambda last: {"after": last["submitted_at"], "after_id": last["id"]})
+
+    assert [submission_id for page in pages for submission_id in page] == everything
+    assert everything == sorted(everything)
+    assert len(everything) == 5
@@ -0,0 +1,57 @@
+import pytest
+
+from app.models import DouyinAccount
+from app.services import distribution
+
+ACCOUNTS_URL = "/api/v1/users/me/accounts/douyin"
+
+
+@pytest.fixture
+def blogger_with_account(db, make_user):
+    blogger = make_user()
+    account = DouyinAccount(user_id=blogger.id, account_name="dy", account_id="dy-1", follower_count=5)
+    db.add(account)
+    db.commit()
+    return blogger, account
+
+
+def _warm_cache():
+    distribution._eligible_cache[("douyin", 10)] = (0, ())
+
+
+def test_account_update_invalidates_eligible_cache(client, auth_headers, blogger_with_account):
+    blogger, account = blogger_with_account
+    _warm_cache()
+
+    response = client.patch(
+        f"{ACCOUNTS_URL}/{account.id}", json={"follower_count": 500}, headers=auth_headers(blogger)
+    )
+
+    assert response.status_code == 200
+    assert len(distribution._eligible_cache) == 0
+
+
+def test_account_add_and_delete_invalidate_eligible_cache(client, auth_headers, blogger_with_account):
+    blogger, account = blogger_with_account
+    _warm_cache()
+    response = client.post(
+        ACCOUNTS_URL, json={"account_name": "dy2", "account_id": "dy-2"}, headers=auth_headers(blogger)
+    )
+    assert response.status_code == 201
+    assert len(distribution._eligible_cache) == 0
+
+    _warm_cache()
+    response = client.delete(f"{ACCOUNTS_URL}/{account.id}", headers=auth_headers(blogger))
+    assert response.status_code == 204
+    assert len(distribution._eligible_cache) == 0
+
+
+def test_eligible_summary_reflects_new_account(client, admin, auth_headers, make_user, make_task):
+    blogger = make_user()
+    task = make_task(platform="douyin")
+    summary_url = f"/api/v1/admin/tasks/{task.id}/eligible-bloggers-summary"
+    assert client.get(summary_url, headers=auth_headers(admin)).json()["eligible_count"] == 0
+
+    client.post(ACCOUNTS_URL, json={"account_name": "dy", "account_id": "dy-1"}, headers=auth_headers(blogger))
+
+    assert client.get(summary_url, headers=auth_headers(admin)).json()["eligible_count"] == 1
@@ -0,0 +1,34 @@
+import pytest
+
+REGISTER_URL = "/api/v1/auth/register"
+
+
+def _payload(email: str, phone: str) -> dict:
+    return {
+        "email": email,
+        "phone": phone,
+        "username": email.split("@")[0],
+        "password": "password123",
+        "douyin_accounts": [{"account_name": "acc", "account_id": email, "follower_count": 10}],
+    }
+
+
+@pytest.mark.parametrize("recreated_index", ["ix_users_email", "ix_users_phone"])
+def test_duplicate_email_reported_before_phone(engine, client, recreated_index):
+    # Recreating one index changes which unique index SQLite checks first.
+    with engine.begin() as conn:
+        sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type='index' AND name = ?", (recreated_index,)
+        ).scalar()
+        conn.exec_driver_sql(f"DROP INDEX {recreated_index}")
+        conn.exec_driver_sql(sql)
+
+    assert client.post(REGISTER_URL, json=_payload("a@example.com", "13800000000")).status_code == 201
+
+    both = client.post(REGISTER_URL, json=_payload("a@example.com", "13800000000"))
+    assert both.status_code == 400
+    assert both.json()["detail"] == "Email already registered"
+
+    phone_only = client.post(REGISTER_URL, json=_payload("b@example.com", "13800000000"))
+    assert phone_only.status_code == 400
+    assert phone_only.json()["detail"] == "Phone already registered"
@@ -0,0 +1,11 @@
+from app.services.revenue import get_revenue_config
+
+
+def test_upsert_invalidates_revenue_config_cache(db, client, admin, auth_headers):
+    url = "/api/v1/admin/platform-configs/douyin"
+    client.put(url, json={"platform_coef": 1.5}, headers=auth_headers(admin))
+    assert get_revenue_config(db, "douyin").platform_coef == 1.5
+
+    client.put(url, json={"platform_coef": 2.5}, headers=auth_headers(admin))
+
+    assert get_revenue_config(db, "douyin").platform_coef == 2.5
@@ -0,0 +1,106 @@
+import pytest
+from sqlmodel import func, select
+
+from app.models import Assignment, AssignmentStatus, MetricSyncStatus, User
+from app.routers import admin as admin_router
+
+COMPLETED = {"status": AssignmentStatus.completed, "metric_sync_status": MetricSyncStatus.manual_approved}
+
+
+def _aggregate_revenue(db, user_id: int) -> float:
+    return db.exec(
+        select(func.coalesce(func.sum(Assignment.revenue), 0.0))
+        .where(Assignment.user_id == user_id)
+        .where(Assignment.status == AssignmentStatus.completed)
+        .where(Assignment.metric_sync_status == MetricSyncStatus.manual_approved)
+    ).one()
+
+
+def _trigger_revenue(db, user_id: int) -> float:
+    return db.exec(select(User.total_revenue).where(User.id == user_id)).one()
+
+
+def _assert_totals_match(db, *users: User) -> None:
+    for user in users:
+        assert _trigger_revenue(db, user.id) == pytest.approx(_aggregate_revenue(db, user.id))
+
+
+def test_trigger_total_follows_insert_update_delete(db, make_user, make_task, make_assignment):
+    alice, bob = make_user(), make_user()
+    task = make_task()
+
+    counted = make_assignment(task, alice, revenue=12.5, **COMPLETED)
+    pending = make_assignment(task, alice, revenue=7.0)
+    _assert_totals_match(db, alice, bob)
+    assert _trigger_revenue(db, alice.id) == pytest.approx(12.5)
+
+    # Approving, re-pricing and moving assignments between users.
+    pending.status = AssignmentStatus.completed
+    pending.metric_sync_status = MetricSyncStatus.manual_approved
+    db.add(pending)
+    db.commit()
+    _assert_totals_match(db, alice, bob)
+
+    counted.revenue = 20.0
+    db.add(counted)
+    db.commit()
+    _assert_totals_match(db, alice, bob)
+
+    pending.user_id = bob.id
+    db.add(pending)
+    db.commit()
+    _assert_totals_match(db, alice, bob)
+
+    counted.metric_sync_status = MetricSyncStatus.manual_rejected
+    db.add(counted)
+    db.commit()
+    _assert_totals_match(db, alice, bob)
+
+    db.delete(pending)
+    db.commit()
+    _assert_totals_match(db, alice, bob)
+    assert _trigger_revenue(db, bob.id) == pytest.approx(0.0)
+
+
+def test_settlement_summary_matches_aggregate_fallback(
+    monkeypatch, client, admin, auth_headers, make_user, make_task, make_assignment
+):
+    alice, bob = make_user(), make_user()
+    task = make_task()
+    make_assignment(task, alice, revenue=30.0, **COMPLETED)
+    make_assignment(task, alice, revenue=5.0)
+    make_assignment(task, bob, revenue=11.25, **COMPLETED)
+
+    def summary():
+        response = client.get("/api/v1/admin/settlements/summary", headers=auth_headers(admin))
+        assert response.status_code == 200
+        body = response.json()
+        return body["total_revenue"], {row["user_id"]: row["total_revenue"] for row in body["users"]}
+
+    from_trigger = summary()
+    monkeypatch.setattr(
+        admin_router, "_settlement_revenue_column", lambda db: admin_router._SETTLEMENT_REVENUE_SUM
+    )
+    from_aggregate = summary()
+
+    assert from_trigger == from_aggregate
+    assert from_aggregate[0] == pytest.approx(41.25)
+
+
+def test_settlement_record_uses_aggregate_fallback(
+    monkeypatch, client, admin, auth_headers, make_user, make_task, make_assignment
+):
+    alice = make_user()
+    make_assignment(make_task(), alice, revenue=30.0, **COMPLETED)
+    monkeypatch.setattr(
+        admin_router, "_settlement_revenue_column", lambda db: admin_router._SETTLEMENT_REVENUE_SUM
+    )
+
+    detail = client.get(f"/api/v1/admin/settlements/{alice.id}", headers=auth_headers(admin))
+    assert detail.status_code == 200
+    assert detail.json()["summary"]["total_revenue"] == pytest.approx(30.0)
+
+    overpaid = client.post(
+        f"/api/v1/admin/settlements/{alice.id}/records", json={"amount": 31.0}, headers=auth_headers(admin)
+    )
+    assert overpaid.status_code == 400
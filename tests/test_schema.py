@@ -0,0 +1,45 @@
+from sqlalchemy import inspect
+
+from app.db import database
+
+
+def _trigger_names(engine) -> set[str]:
+    with engine.connect() as conn:
+        return {
+            row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='trigger'")
+        }
+
+
+def test_schema_pass_is_idempotent(engine):
+    database.create_db_and_tables()
+    assert _trigger_names(engine) == set(database.SQLITE_TRIGGERS)
+
+
+def test_schema_pass_restores_dropped_index_and_trigger(engine, db, make_user, make_task, make_assignment):
+    user = make_user()
+    make_assignment(make_task(), user, revenue=9.0, status="completed", metric_sync_status="manual_approved")
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_assignments_user_revenue")
+        conn.exec_driver_sql("DROP TRIGGER trg_assignments_revenue_ai")
+        conn.exec_driver_sql("UPDATE users SET total_revenue = 0")
+
+    database.create_db_and_tables()
+
+    index_names = {index["name"] for index in inspect(engine).get_indexes("assignments")}
+    assert "ix_assignments_user_revenue" in index_names
+    assert _trigger_names(engine) == set(database.SQLITE_TRIGGERS)
+    # Recreating a trigger backfills the totals it may have missed.
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT total_revenue FROM users").scalar() == 9.0
+
+
+def test_schema_pass_skips_backfill_when_triggers_match(engine, db, make_user):
+    make_user()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE users SET total_revenue = 5")
+
+    database.create_db_and_tables()
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT total_revenue FROM users").scalar() == 5
@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import select
+
+from app.models import Task, TaskStatus
+
+STALE = datetime(2020, 1, 1)
+
+
+def test_orm_update_stamps_updated_at(db, make_task):
+    task = make_task()
+    task.updated_at = STALE
+    db.add(task)
+    db.commit()
+    assert db.exec(select(Task.updated_at).where(Task.id == task.id)).one() == STALE
+
+    task.title = "renamed"
+    db.add(task)
+    db.commit()
+
+    # The Python-side onupdate value is also set on the instance, which is not reloaded.
+    assert task.updated_at > STALE
+    assert db.exec(select(Task.updated_at).where(Task.id == task.id)).one() == task.updated_at
+
+
+def test_update_statement_stamps_updated_at(db, client, admin, auth_headers, make_task):
+    task = make_task(status=TaskStatus.draft, created_at=STALE, updated_at=STALE)
+
+    response = client.post(f"/api/v1/admin/tasks/{task.id}/publish", headers=auth_headers(admin))
+
+    assert response.status_code == 200
+    updated_at = datetime.fromisoformat(response.json()["updated_at"])
+    assert datetime.utcnow() - updated_at < timedelta(minutes=1)
@@ -0,0 +1,68 @@
+from app.core import user_cache
+from app.models import Role
+
+TASKS_URL = "/api/v1/tasks/"
+
+
+def test_deactivated_user_is_rejected_immediately(db, client, make_user, auth_headers):
+    blogger = make_user()
+    assert client.get(TASKS_URL, headers=auth_headers(blogger)).status_code == 200
+    assert user_cache.get(blogger.id) is not None
+
+    blogger.is_active = False
+    db.add(blogger)
+    db.commit()
+
+    assert user_cache.get(blogger.id) is None
+    response = client.get(TASKS_URL, headers=auth_headers(blogger))
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Inactive user"
+
+
+def test_role_change_is_picked_up_immediately(db, client, make_user, admin, auth_headers):
+    assert client.get("/api/v1/admin/users", headers=auth_headers(admin)).status_code == 200
+
+    admin.role = Role.blogger
+    db.add(admin)
+    db.commit()
+
+    assert client.get("/api/v1/admin/users", headers=auth_headers(admin)).status_code == 403
+
+
+def test_admin_review_is_picked_up_immediately(client, make_user, admin, auth_headers):
+    blogger = make_user()
+    assert client.get(TASKS_URL, headers=auth_headers(blogger)).status_code == 200
+
+    response = client.patch(
+        f"/api/v1/admin/users/{blogger.id}/review",
+        json={"review_status": "under_review"},
+        headers=auth_headers(admin),
+    )
+    assert response.status_code == 200
+
+    response = client.get(TASKS_URL, headers=auth_headers(blogger))
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Account not approved"
+
+
+def test_unrelated_change_keeps_cache_entry(db, client, make_user, auth_headers):
+    blogger = make_user()
+    client.get(TASKS_URL, headers=auth_headers(blogger))
+
+    blogger.city = "Shanghai"
+    db.add(blogger)
+    db.commit()
+
+    assert user_cache.get(blogger.id) is not None
+
+
+def test_rolled_back_change_keeps_cache_entry(db, client, make_user, auth_headers):
+    blogger = make_user()
+    client.get(TASKS_URL, headers=auth_headers(blogger))
+
+    blogger.is_active = False
+    db.add(blogger)
+    db.flush()
+    db.rollback()
+
+    assert user_cache.get(blogger.id) is not None